@@ -2,27 +2,86 @@
 Hensor Workbench - Main Entry Point.
 AI-powered CMS for the Royal Museums of Fine Arts of Belgium.
 
-This is the application entry point. It imports all page modules
-(which register their own routes via @ui.page decorators) and starts the server.
+This is the application entry point. It registers a lightweight placeholder
+route for every page and starts the server. The page modules themselves
+(and their dependency chains: OpenAI SDK, Supabase client, ...) are only
+imported when a page is visited for the first time.
 """
 
-from nicegui import ui
+import asyncio
+import importlib
+import sys
+
+from dotenv import load_dotenv
+from nicegui import app, ui
 from config import settings
+import routes
+
+# Load .env into the process environment once, for all backend modules
+load_dotenv()
+
+# Use uvloop (libuv-based, lower per-callback overhead) when installed; it isn't available on Windows
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    EVENT_LOOP = 'uvloop'
+except ImportError:
+    EVENT_LOOP = 'auto'
+
+# Route -> (page module, page function)
+# Each page module uses @ui.page('/route') to register itself once imported,
+# which replaces the lazy placeholder route registered below.
+PAGES = {
+    routes.ROUTE_HOME: ('pages.search', 'page'),
+    routes.ROUTE_SEARCH: ('pages.search', 'page'),
+    routes.ROUTE_DETAIL: ('pages.detail', 'page'),
+    routes.ROUTE_LABEL: ('pages.label', 'label_page'),
+    routes.ROUTE_CHAT: ('pages.chat', 'page'),
+    routes.ROUTE_INSIGHTS: ('pages.insights', 'page'),
+    routes.ROUTE_LOGIN: ('pages.login', 'page'),
+}
+
+# Cache of imported page modules (module name -> module)
+_loaded_pages = {}
+
+
+def _load_page_module(module_name: str):
+    """Import a page module on first use and cache it."""
+    module = _loaded_pages.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+        _loaded_pages[module_name] = module
+    return module
+
+
+def _register_lazy_page(route: str, module_name: str, func_name: str) -> None:
+    """Register a placeholder page that imports and renders the real page on first request."""
+    @ui.page(route)
+    def _lazy_page():
+        module = _load_page_module(module_name)
+        getattr(module, func_name)()
+
+
+for _route, (_module_name, _func_name) in PAGES.items():
+    _register_lazy_page(_route, _module_name, _func_name)
+
+
+async def _close_backend_clients() -> None:
+    """Close the pooled Supabase connections on shutdown (only if a page ever loaded the backend)."""
+    supabase_client = sys.modules.get('backend.supabase_client')
+    if supabase_client is not None:
+        await supabase_client.close_clients()
+
+
+app.on_shutdown(_close_backend_clients)
 
-# Import all pages to register their routes
-# Each page module uses @ui.page('/route') to register itself
-import pages.search
-import pages.detail
-import pages.label
-import pages.chat
-import pages.insights
-import pages.login
 
 if __name__ in {"__main__", "__mp_main__"}:
     ui.run(
         title=settings.title,
         host=settings.host,
         port=settings.port,
-        reload=settings.reload,
-        storage_secret=settings.session_secret  # Required for app.storage.user
+        reload=settings.reload,  # Set FABRITIUS_RELOAD=false in production
+        storage_secret=settings.session_secret,  # Required for app.storage.user
+        loop=EVENT_LOOP  # Passed on to uvicorn
     )
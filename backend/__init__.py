@@ -11,13 +11,14 @@ MODULES
 supabase_client.py
     Database access layer for all Supabase operations.
     - SupabaseClient: Main class for DB interactions
+    - get_supabase_client(): process-wide shared instance (use this in pages/operators)
     - Vector search (semantic similarity using pgvector)
     - Metadata filtering and full-text search
     - Tag management and artwork-tag relationships
     - Stored procedures: vector_search, metadata_filter, etc.
     
     Example:
-        db = SupabaseClient()
+        db = get_supabase_client()
         results = db.vector_search(query_embedding, top_k=10)
 
 llms.py
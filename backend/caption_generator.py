@@ -1,40 +1,99 @@
 # This script is used to generate captions for images in the fabritius dataset online.
 
-from backend.supabase_client import SupabaseClient
+from backend.supabase_client import SupabaseClient, invalidate_artwork_metadata
 from loguru import logger
-from backend.llms import LLMClient
-from backend.prompts import FULL_PROMPT_VISION
+from backend.llms import LLMClient, close_async_client
+from backend.prompts import FULL_PROMPT_VISION, VISION_PROMPT_FINGERPRINT
 
-from datetime import datetime, timedelta
+from dotenv import load_dotenv
 import argparse
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
 
 
+# Host serving the artwork images (imageOpacLink is a path on this host)
+BASE_IMAGE_HOST = "http://193.190.214.119"
 
-def get_n_uncaptioned_artworks(db: SupabaseClient, n: int = 5, offset: int = 0) -> list:
-    """Get n artworks that have images but no captions."""
+# Maximum number of GPT Vision calls in flight at the same time
+CAPTION_CONCURRENCY = 16
+
+# Number of finished captions written to Supabase per batched UPDATE (update_captions RPC)
+CAPTION_FLUSH_SIZE = 25
+
+# Local on-disk cache of GPT Vision captions (reruns/crash-resumes don't re-bill OpenAI).
+# Anchored to the project root, so the CLI and the web app share it whatever the working directory.
+CAPTION_CACHE_PATH = Path(__file__).resolve().parent.parent / ".caption_cache.sqlite"
+
+# Cache entries are keyed on the prompt too, so editing FULL_PROMPT_VISION invalidates them
+FULL_PROMPT_VISION_VERSION = VISION_PROMPT_FINGERPRINT[:16]
+
+_caption_cache = None
+# The connection is shared by the batch job's event loop and the web app's handler threads;
+# hold this lock for every use of it (a sqlite3 connection is not safe for concurrent use)
+_caption_cache_lock = threading.Lock()
+
+
+def _get_caption_cache() -> sqlite3.Connection:
+    """Open (and create if needed) the local caption cache on first use. Call with _caption_cache_lock held."""
+    global _caption_cache
+    if _caption_cache is None:
+        _caption_cache = sqlite3.connect(CAPTION_CACHE_PATH, check_same_thread=False)
+        _caption_cache.execute("CREATE TABLE IF NOT EXISTS captions (key TEXT PRIMARY KEY, caption TEXT NOT NULL)")
+    return _caption_cache
+
+
+def _caption_cache_key(image_url: str) -> str:
+    """Cache key for an image URL under the current vision prompt.
+
+    For data: URLs (uploaded images) the URL is the image content, so the key is a content hash.
+    """
+    return hashlib.sha256(f"{FULL_PROMPT_VISION_VERSION}|{image_url}".encode("utf-8")).hexdigest()
+
+
+def get_cached_caption(image_url: str) -> str:
+    """Return the cached caption for an image URL, or None."""
+    key = _caption_cache_key(image_url)
+    with _caption_cache_lock:
+        row = _get_caption_cache().execute("SELECT caption FROM captions WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def set_cached_caption(image_url: str, caption: str) -> None:
+    """Store a generated caption in the local cache."""
+    key = _caption_cache_key(image_url)
+    with _caption_cache_lock:
+        cache = _get_caption_cache()
+        cache.execute("INSERT OR REPLACE INTO captions (key, caption) VALUES (?, ?)", (key, caption))
+        cache.commit()
+
+
+
+def get_uncaptioned_page(db: SupabaseClient, n: int = 5, after_inv: str = None) -> list:
+    """Get up to n artworks that have images but no captions.
+
+    Uses keyset pagination on inventarisnummer: pass the last inventory number
+    of the previous page as `after_inv` to get the next page. The filtering happens
+    server-side in the get_uncaptioned stored procedure, backed by a partial index
+    on the uncaptioned subset (sql/create_indexes.sql).
+    """
     try:
-        # Get first artwork with image but no caption
-        response = (db.client.table("fabritius")
-                   .select("inventarisnummer, imageOpacLink")
-                   .neq("imageOpacLink", None)
-                   .neq("imageOpacLink", "")  # Exclude empty strings
-                   .neq("imageOpacLink", " ")  # Exclude single spaces
-                   .is_("gpt_vision_caption", "null")
-                   .limit(n)
-                   .offset(offset)  # Add offset to skip records
-                   .execute())
+        response = db.client.rpc("get_uncaptioned", {"n": n, "after": after_inv}).execute()
         
         if response.data:
             artworks = response.data
-            logger.info(f"Found {len(artworks)} artworks (offset: {offset})")
+            logger.info(f"Found {len(artworks)} artworks (after: {after_inv})")
             return artworks
         else:
-            logger.info(f"No uncaptioned artworks found (offset: {offset})")
-            return None
+            logger.info(f"No uncaptioned artworks found (after: {after_inv})")
+            return []
             
     except Exception as e:
         logger.error(f"Error fetching artwork: {e}")
-        return None
+        return []
 
 
 def update_artwork_caption(db: SupabaseClient, inventory_number: str, caption: str) -> bool:
@@ -46,6 +105,7 @@ def update_artwork_caption(db: SupabaseClient, inventory_number: str, caption: s
                    .execute())
         
         if response.data:
+            invalidate_artwork_metadata([inventory_number])
             logger.info(f"Updated caption for {inventory_number}")
             return True
         return False
@@ -54,68 +114,136 @@ def update_artwork_caption(db: SupabaseClient, inventory_number: str, caption: s
         logger.error(f"Error updating caption for {inventory_number}: {e}")
         return False
 
-def update_artwork_captions(db: SupabaseClient, artworks: list) -> None:
-    """Update artworks with captions GPT Vision."""
+def flush_captions(db: SupabaseClient, buffer: list) -> bool:
+    """Write a batch of (inventory_number, caption) pairs in a single UPDATE.
+
+    One HTTP round-trip per batch instead of one UPDATE per artwork, through the update_captions
+    stored procedure (sql/stored_procedures.sql); unknown inventory numbers are skipped.
+    """
+    if not buffer:
+        return True
+    try:
+        response = db.client.rpc(
+            "update_captions",
+            {"captions": [{"inventarisnummer": inv, "caption": caption} for inv, caption in buffer]}
+        ).execute()
+
+        updated = response.data or 0
+        if updated:
+            invalidate_artwork_metadata([inv for inv, _ in buffer])
+            if updated < len(buffer):
+                logger.warning(f"Updated captions for {updated} of {len(buffer)} artworks (others not found)")
+            else:
+                logger.info(f"Updated captions for {len(buffer)} artworks")
+            return True
+        return False
+
+    except Exception as e:
+        logger.error(f"Error updating captions for {len(buffer)} artworks: {e}")
+        return False
+
+async def update_artwork_captions(db: SupabaseClient, artworks: list, concurrency: int = CAPTION_CONCURRENCY) -> None:
+    """Update artworks with captions GPT Vision.
+
+    Artworks are processed concurrently: at most `concurrency` GPT Vision calls
+    are in flight at the same time. Finished captions are buffered and written
+    to Supabase in batches of CAPTION_FLUSH_SIZE (see flush_captions).
+    """
     total = len(artworks)
+    if not total:
+        logger.info("No artworks to process")
+        return
+
     successful = 0
     failed = 0
-    start_time = datetime.now()
-    runtimes = []
-
-    logger.info(f"Starting to process {total} artworks...")
-    for idx, artwork in enumerate(artworks, 1):
-        item_start = datetime.now()
-        logger.info(f"Processing artwork {idx}/{total}: {artwork['inventarisnummer']}")
-
-        try:
-            image_url = f"http://193.190.214.119{artwork['imageOpacLink']}"    
-            # Generate caption using GPT Vision
-            caption = generate_gpt_vision_caption(image_url)
-
-            if caption: 
-                    success = update_artwork_caption(   
-                        db=db,
-                        inventory_number=artwork['inventarisnummer'],
-                        caption=caption
-                    )
-            if success:
-                successful += 1
-                logger.info(f"✓ Updated {artwork['inventarisnummer']} ({idx}/{total})")
-            else:
+    done = 0
+    total_s = 0.0  # summed per-item runtime (seconds)
+    start = time.monotonic()
+    semaphore = asyncio.Semaphore(concurrency)
+    buffer = []  # (inventarisnummer, caption) pairs waiting to be written
+
+    async def _flush() -> None:
+        nonlocal successful, failed
+        batch = buffer[:]
+        buffer.clear()
+        if not batch:
+            return
+        # supabase-py is synchronous: run the batched update in a worker thread
+        if await asyncio.to_thread(flush_captions, db, batch):
+            successful += len(batch)
+            logger.info(f"✓ Saved {len(batch)} captions")
+        else:
+            failed += len(batch)
+            logger.error(f"× Failed to save {len(batch)} captions in database")
+
+    async def _process(artwork: dict) -> None:
+        nonlocal failed, done, total_s
+        async with semaphore:
+            item_start = time.monotonic()
+            logger.info(f"Processing artwork: {artwork['inventarisnummer']}")
+
+            try:
+                image_url = BASE_IMAGE_HOST + artwork['imageOpacLink']
+                # Generate caption using GPT Vision
+                caption = await generate_gpt_vision_caption(image_url)
+
+                if caption:
+                    buffer.append((artwork['inventarisnummer'], caption))
+                    if len(buffer) >= CAPTION_FLUSH_SIZE:
+                        await _flush()
+                else:
+                    failed += 1
+                    logger.error(f"× No caption generated for {artwork['inventarisnummer']}")
+
+            except Exception as e:
                 failed += 1
-                logger.error(f"× Failed to update {artwork['inventarisnummer']} in database")
+                logger.error(f"× Error processing {artwork['inventarisnummer']}: {e}")
 
-        except  Exception as e:
-            failed += 1
-            logger.error(f"× Error processing {artwork['inventarisnummer']}: {e}")
-            continue
-        
-        # Calculate timing for this iteration
-        item_duration = datetime.now() - item_start
-        runtimes.append(item_duration)
-        avg_runtime = sum(runtimes, timedelta()) / len(runtimes)
-        
-        # Progress summary with timing
-        logger.info(f"Progress: {successful} successful, {failed} failed, {total-idx} remaining")
-        logger.info(f"Time: This item: {item_duration.seconds}s, Average: {avg_runtime.seconds}s")
-        
-        if total-idx > 0:  # Estimate remaining time
-            est_remaining = avg_runtime * (total-idx)
-            est_completion = datetime.now() + est_remaining
-            logger.info(f"Estimated completion at: {est_completion.strftime('%H:%M:%S')}")
+            finally:
+                # Failed items count as done too, so progress and ETA reach the total
+                done += 1
+                item_duration = time.monotonic() - item_start
+                total_s += item_duration
+                avg_runtime = total_s / done
+
+            # Progress summary with timing
+            logger.info(f"Progress: {successful} saved, {len(buffer)} pending, {failed} failed, {total-done} remaining")
+            logger.info(f"Time: This item: {item_duration:.0f}s, Average: {avg_runtime:.0f}s")
+
+            if total-done > 0:  # Estimate remaining time (items run `concurrency` at a time)
+                est_remaining = avg_runtime * (total-done) / concurrency
+                est_completion = time.localtime(time.time() + est_remaining)
+                logger.info(f"Estimated completion at: {time.strftime('%H:%M:%S', est_completion)}")
+
+    logger.info(f"Starting to process {total} artworks ({concurrency} concurrent)...")
+    try:
+        await asyncio.gather(*(_process(artwork) for artwork in artworks), return_exceptions=True)
+        await _flush()  # write the remaining captions
+    finally:
+        # The async OpenAI client's pool is tied to this event loop: don't leave it for the next run
+        await close_async_client()
 
     # Final summary
-    total_duration = datetime.now() - start_time
+    total_duration = time.monotonic() - start
     logger.info("\n=== Caption Generation Summary ===")
-    logger.info(f"Total time: {total_duration}")
-    logger.info(f"Average time per artwork: {sum(runtimes, timedelta()) / len(runtimes)}")
+    logger.info(f"Total time: {total_duration:.1f}s")
+    if done:
+        logger.info(f"Average time per artwork: {total_s / done:.1f}s")
     logger.info(f"Successful: {successful}/{total} ({(successful/total)*100:.1f}%)")
     logger.info(f"Failed: {failed}/{total}")
 
 
-def generate_gpt_vision_caption(image_url: str) -> str:
-    """Generate a caption for an image using GPT Vision."""
+async def generate_gpt_vision_caption(image_url: str) -> str:
+    """Generate a caption for an image using GPT Vision.
+
+    Captions are cached locally by image URL + prompt version (see get_cached_caption).
+    """
     try:
+        cached = get_cached_caption(image_url)
+        if cached:
+            logger.info("Using cached caption")
+            return cached
+
         llm = LLMClient()
         
         # Use the URL-specific method (other method works with string)
@@ -125,10 +253,11 @@ def generate_gpt_vision_caption(image_url: str) -> str:
         )
         
         # Get response from GPT Vision
-        response = llm.prompt_llm(prompt_obj)
+        response = await llm.aprompt_llm(prompt_obj)
         
         if response and response.output_text:
             logger.info("Successfully generated caption")
+            set_cached_caption(image_url, response.output_text)
             return response.output_text
         else:
             logger.error("No caption generated")
@@ -149,13 +278,19 @@ def generate_caption_from_base64(image_base64: str) -> str:
         Caption text or None if failed
     """
     try:
-        llm = LLMClient()
-        
         # Construct data URL if not already present
         if not image_base64.startswith('data:image'):
             image_url = f"data:image/jpeg;base64,{image_base64}"
         else:
             image_url = image_base64
+
+        # Same image uploaded again -> reuse the caption (keyed on content + prompt fingerprint)
+        cached = get_cached_caption(image_url)
+        if cached:
+            logger.info("Using cached caption for uploaded image")
+            return cached
+
+        llm = LLMClient()
         
         # Use the URL method (works with data URLs too)
         prompt_obj = llm.create_llm_message_with_image_url(
@@ -168,6 +303,7 @@ def generate_caption_from_base64(image_base64: str) -> str:
         
         if response and response.output_text:
             logger.info("Successfully generated caption from uploaded image")
+            set_cached_caption(image_url, response.output_text)
             return response.output_text
         else:
             logger.error("No caption generated from uploaded image")
@@ -186,6 +322,7 @@ def clear_all_captions(db: SupabaseClient) -> bool:
                    .update({"gpt_vision_caption": None})
                    .neq("gpt_vision_caption", None)
                    .execute())
+        invalidate_artwork_metadata()
        
     
     except Exception as e:
@@ -193,23 +330,17 @@ def clear_all_captions(db: SupabaseClient) -> bool:
         return False
 
 def get_caption_stats(db: SupabaseClient) -> tuple[int, int]:
-    """Get statistics about captioned and uncaptioned artworks."""
+    """Get statistics about captioned and uncaptioned artworks.
+
+    Both counts come from the get_caption_stats stored procedure
+    (sql/stored_procedures.sql): one table scan, one round-trip.
+    """
     try:
-        # Get total count of artworks with images
-        total_response = (db.client.table("fabritius")
-                        .select("*", count="exact")
-                        .neq("imageOpacLink", None)
-                        .execute())
-        
-        # Get count of captioned artworks
-        captioned_response = (db.client.table("fabritius")
-                            .select("*", count="exact")
-                            .neq("imageOpacLink", None)
-                            .neq("gpt_vision_caption", None)
-                            .execute())
-        
-        total = total_response.count
-        captioned = captioned_response.count
+        response = db.client.rpc("get_caption_stats").execute()
+
+        row = response.data[0] if response.data else {}
+        total = row.get("total", 0)
+        captioned = row.get("captioned", 0)
         
         return captioned, total
     
@@ -222,11 +353,15 @@ def main():
     parser = argparse.ArgumentParser(description='Generate captions for artworks')
     parser.add_argument('-n', '--number', type=int, default=5,
                        help='Number of artworks to process (default: 5)')
-    parser.add_argument('-o', '--offset', type=int, default=0,
-                       help='Skip first N artworks (default: 0)')
+    parser.add_argument('-a', '--after', type=str, default=None,
+                       help='Only process artworks with an inventory number after this one (default: start from the first)')
+    parser.add_argument('-c', '--concurrency', type=int, default=CAPTION_CONCURRENCY,
+                       help=f'Number of artworks captioned concurrently (default: {CAPTION_CONCURRENCY})')
     parser.add_argument('--stats', action='store_true',
                        help='Only show statistics without processing')
     args = parser.parse_args()
+
+    load_dotenv()  # CLI entry point: load .env once before creating any clients
     
     db = SupabaseClient()
 
@@ -236,22 +371,17 @@ def main():
     logger.info(f"Total artworks with images: {total}")
     logger.info(f"Already captioned: {captioned}")
     logger.info(f"Remaining to caption: {total - captioned}")
-    logger.info(f"Progress: {(captioned/total)*100:.1f}%\n")
+    if total:
+        logger.info(f"Progress: {(captioned/total)*100:.1f}%\n")
 
 
-    #offset zorgt ervoor dat we artworks kunnen skippen in multi-threaded mode
-    artworks = get_n_uncaptioned_artworks(db, n=args.number, offset=args.offset)
+    artworks = get_uncaptioned_page(db, n=args.number, after_inv=args.after)
 
     if artworks:
         logger.info(f"Starting caption generation for {len(artworks)} artworks...")
 
-        # Process each artwork
-        for artwork in artworks:
-             image_url = f"{artwork['inventarisnummer']}  http://193.190.214.119{artwork['imageOpacLink']}"
-             logger.info(f"Image URL: {image_url}")
-        
         # Generate and update captions
-        update_artwork_captions(db, artworks)
+        asyncio.run(update_artwork_captions(db, artworks, concurrency=args.concurrency))
         
         logger.info("Finished processing batch")
     
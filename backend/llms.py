@@ -2,32 +2,150 @@
 import os
 from typing import List  # library to interact with operating system
 import openai  # Library for interacting with the OpenAI API
-import json  # Library for working with JSON data
+import orjson  # Fast JSON parsing (C implementation, returns native Python objects)
 
 #schema for structured output
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict
 
 import base64
+import functools
+import mmap
 from loguru import logger  # Custom logger for logging messages
 
-# API keys - try FABRITIUS_ prefix first, fallback to direct name
-from dotenv import load_dotenv # Load environment variables from a .env file
-load_dotenv()  # Load environment variables from .env file
-openai_api_key = os.getenv("FABRITIUS_OPENAI_API_KEY") or os.getenv("OPENAI_API_KEY")
-if not openai_api_key:
-    raise ValueError("De OPENAI_API_KEY omgevingsvariabele is niet ingesteld. Gebruik FABRITIUS_OPENAI_API_KEY of OPENAI_API_KEY.")
-
 #AI libraries
-from openai import OpenAI  # Class for creating OpenAI clients
-client = OpenAI(api_key=openai_api_key)  # Create OpenAI client
+from openai import OpenAI, AsyncOpenAI  # Classes for creating OpenAI clients
+
+import httpx  # HTTP client used by the OpenAI SDK (pool/HTTP2 configuration)
+
+# Connection pool settings for the async client
+ASYNC_MAX_CONNECTIONS = 64
+ASYNC_MAX_KEEPALIVE = 32
+ASYNC_TIMEOUT = 60  # seconds
+ASYNC_MAX_RETRIES = 4
+
+# Shared OpenAI clients, created on first use (see _get_client / _get_async_client)
+_client = None
+_async_client = None
+
+
+def _get_api_key() -> str:
+    """Read the OpenAI API key from the environment.
+
+    .env is loaded once by the application entry point (Fabritius-NG.py or a CLI main()).
+    """
+    # API keys - try FABRITIUS_ prefix first, fallback to direct name
+    openai_api_key = os.getenv("FABRITIUS_OPENAI_API_KEY") or os.getenv("OPENAI_API_KEY")
+    if not openai_api_key:
+        raise ValueError("De OPENAI_API_KEY omgevingsvariabele is niet ingesteld. Gebruik FABRITIUS_OPENAI_API_KEY of OPENAI_API_KEY.")
+    return openai_api_key
+
+
+def _get_client() -> OpenAI:
+    """Return the shared OpenAI client, creating it on first use.
+
+    Keeps module import free of .env parsing and client construction, so
+    pages that never call an LLM don't pay for it at startup.
+    """
+    global _client
+    if _client is None:
+        _client = OpenAI(api_key=_get_api_key())  # Create OpenAI client
+    return _client
+
+
+def _get_async_client() -> AsyncOpenAI:
+    """Return the shared async OpenAI client (used for concurrent batch jobs).
+
+    Bound to the running event loop: close it with close_async_client before that loop ends.
+
+    Backed by a pooled HTTP/2 httpx client, so many concurrent requests
+    (e.g. asyncio.gather in caption_generator) share a few TLS connections.
+    Transient failures (429/5xx/timeouts) are retried with exponential backoff by the SDK.
+    """
+    global _async_client
+    if _async_client is None:
+        http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=ASYNC_MAX_CONNECTIONS, max_keepalive_connections=ASYNC_MAX_KEEPALIVE),
+            timeout=ASYNC_TIMEOUT,
+        )
+        _async_client = AsyncOpenAI(api_key=_get_api_key(), http_client=http_client, max_retries=ASYNC_MAX_RETRIES)
+    return _async_client
+
+
+async def close_async_client() -> None:
+    """Close the shared async OpenAI client and its connection pool.
+
+    Its pooled connections belong to the event loop that opened them, so a batch job
+    calls this before its loop ends; the next job (e.g. another asyncio.run) gets a fresh client.
+    """
+    global _async_client
+    if _async_client is not None:
+        client, _async_client = _async_client, None
+        await client.close()  # also closes the httpx.AsyncClient passed as http_client
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_for(pydantic_model) -> dict:
+    """JSON schema for structured output, built once per pydantic model class.
+
+    Serialization mode lists fields with a default (e.g. Optional[...] = None) as required,
+    as OpenAI strict mode demands; the "default": null entries are stripped for the same reason.
+    """
+    schema_json = pydantic_model.model_json_schema(mode="serialization")
+    _strip_null_defaults(schema_json)
+    schema_json["additionalProperties"] = False #required parameter!
+    return schema_json
+
+
+@functools.lru_cache(maxsize=None)
+def _text_format_for(pydantic_model) -> dict:
+    """Responses API text.format block for a pydantic model, built once per model class."""
+    return {
+        "format": {
+            "type": "json_schema",
+            "name": "CMS_schema",
+            "schema": _schema_for(pydantic_model),
+            "strict": True
+        }
+    }
+
+
+def _strip_null_defaults(node) -> None:
+    """Remove "default": None entries from a JSON schema, in place."""
+    if isinstance(node, dict):
+        if "default" in node and node["default"] is None:
+            del node["default"]
+        for value in node.values():
+            _strip_null_defaults(value)
+    elif isinstance(node, list):
+        for value in node:
+            _strip_null_defaults(value)
+
+
+@functools.lru_cache(maxsize=32)
+def _input_text_part(msg: str) -> dict:
+    """Shared input_text content part for a prompt.
+
+    Vision prompts (e.g. FULL_PROMPT_VISION) are identical for every image in a
+    batch, so the text part is built once and reused; only the image part changes.
+    Treat the returned dict as read-only.
+    """
+    return {"type": "input_text", "text": msg}
 
 
 # Helper function for image encoding (for vision API)
 def encode_image(image_path):
-    """Encode image to base64 string"""
+    """Encode image to base64 string.
+
+    The file is memory-mapped and fed to base64 directly, so large images
+    aren't first copied into a Python bytes object by read().
+    """
     with open(image_path, "rb") as image_file:
-        return base64.b64encode(image_file.read()).decode('utf-8')
+        if os.fstat(image_file.fileno()).st_size == 0:
+            return ""  # mmap can't map an empty file
+        with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as image_data:
+            return base64.b64encode(image_data).decode('ascii')
 
 
 class LLMClient:
@@ -57,7 +175,7 @@ class LLMClient:
         #logger.debug(input)    
                   
         try:
-            response = client.responses.create(
+            response = _get_client().responses.create(
                 model=self.model,
                 previous_response_id=self.last_response_id,  # keep track of the last reponse
                 input=input, #can be text and(!) images
@@ -69,6 +187,24 @@ class LLMClient:
             logger.error(f"OpenAI API-fout: {e}")
             return None
 
+    async def aprompt_llm(self, input_messages):
+        """
+        Async variant of prompt_llm (text/image messages only), so batch jobs
+        can keep many requests in flight on one event loop.
+        """
+        try:
+            response = await _get_async_client().responses.create(
+                model=self.model,
+                previous_response_id=self.last_response_id,  # keep track of the last reponse
+                input=list(input_messages),
+            )
+            # update reponse id state
+            self.last_response_id = response.id
+            return response
+        except openai.OpenAIError as e:
+            logger.error(f"OpenAI API-fout: {e}")
+            return None
+
     """
     def _prepare_image_content(image_path):
         logger.debug(image_path)                    
@@ -95,26 +231,18 @@ class LLMClient:
         #    description: str = Field(..., description="Concise but complete summary of the painting (200-300 words)")
         #    objects: List[str] = Field(..., description="List of objects such as tools, toys, instruments, etc. in the painting")
 
-        schema_json = pydantic_model.model_json_schema()
-        schema_json["additionalProperties"] = False #required parameter!
-        #logger.debug(f"Generated JSON schema: {json.dumps(schema_json, indent=4)}")
+        text_format = _text_format_for(pydantic_model)
+        #logger.debug(f"Generated JSON schema: {orjson.dumps(text_format, option=orjson.OPT_INDENT_2).decode()}")
 
         instruction = "Convert the caption to a structured output format. Caption: {}".format(caption)
-        response = client.responses.create(
+        response = _get_client().responses.create(
             model=LLMClient.DEFAULT_MODEL,
             input = LLMClient.create_llm_message(msg=instruction),
-            text={
-                "format": {
-                    "type": "json_schema",
-                    "name": "CMS_schema",
-                    "schema": schema_json,
-                    "strict": True
-                }
-            },
+            text=text_format,
         )
         #pydantic_model.model_json_schema(),
         logger.debug("convert to structured output: ".format(response.output_text))
-        return json.loads(response.output_text)
+        return orjson.loads(response.output_text)
             
         
     def get_embedding(self, text: str, model: str = DEFAULT_EMBEDDING_MODEL) -> list:
@@ -128,7 +256,7 @@ class LLMClient:
             List of floats representing the embedding vector
         """
         try:
-            response = client.embeddings.create(
+            response = _get_client().embeddings.create(
                 model=model,
                 input=text
             )
@@ -176,10 +304,7 @@ class LLMClient:
             {
                 "role": role, 
                 "content": [
-                    {
-                        "type": "input_text",
-                        "text": msg
-                    },
+                    _input_text_part(msg),
                     {
                         "type": "input_image", 
                         "image_url": image_url,
@@ -1,10 +1,246 @@
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional
+import copy
+import functools
 import os
-from dotenv import load_dotenv
-from supabase import create_client, Client
+import random
+import time
+from datetime import date
+import numpy as np
+import httpx
+from supabase import create_client, Client, ClientOptions
 from .llms import LLMClient
 from loguru import logger
 
+
+# Credentials are read from the environment when a SupabaseClient is created:
+# .env is loaded once by the application entry point (Fabritius-NG.py or a CLI main()).
+
+# Connection pool of the shared Supabase HTTP client
+SUPABASE_MAX_CONNECTIONS = 50
+SUPABASE_MAX_KEEPALIVE = 20
+SUPABASE_KEEPALIVE_EXPIRY = 30  # seconds an idle connection is kept open
+SUPABASE_TIMEOUT = 120  # seconds (read/write), same as the postgrest-py default
+SUPABASE_CONNECT_TIMEOUT = 5.0  # seconds; also the wait for a free pooled connection
+
+# Read queries are retried on transient transport errors (see SupabaseClient._exec).
+# Only errors that fail fast are retried: never ReadTimeout, which already waited SUPABASE_TIMEOUT.
+DB_RETRIES = 3
+DB_RETRY_BACKOFF = 0.1  # seconds, doubled per attempt and jittered
+_TRANSIENT_ERRORS = (httpx.ConnectTimeout, httpx.PoolTimeout, httpx.ConnectError, httpx.RemoteProtocolError)
+
+# Dashboard row counts (row_counts table) are cached in-process: table name -> (timestamp, count)
+ROW_COUNT_TTL = 60  # seconds
+_row_count_cache: Dict[str, tuple] = {}
+
+# Near-static lookups (tag labels, label -> tag id, artwork metadata), cached in-process:
+# (kind, key) -> (timestamp, value). Values go in and come out as (shallow) copies, so callers can
+# modify what they get back; tag writes drop the tag entries, caption writes the artwork's metadata.
+LOOKUP_CACHE_TTL = 300  # seconds
+LOOKUP_CACHE_MAXSIZE = 1024
+_lookup_cache: Dict[tuple, tuple] = {}
+_MISSING = object()
+
+
+def _lookup_get(key: tuple):
+    """Copy of the cached value for key, or _MISSING if absent or older than LOOKUP_CACHE_TTL."""
+    cached = _lookup_cache.get(key)
+    if cached and time.monotonic() - cached[0] < LOOKUP_CACHE_TTL:
+        return copy.copy(cached[1])  # metadata rows are flat dicts, the tag list holds strings
+    return _MISSING
+
+
+def _lookup_put(key: tuple, value) -> None:
+    if len(_lookup_cache) >= LOOKUP_CACHE_MAXSIZE:
+        _lookup_cache.pop(next(iter(_lookup_cache)))  # oldest entry (insertion order)
+    _lookup_cache[key] = (time.monotonic(), copy.copy(value))
+
+
+def _lookup_invalidate(kind: str, key=None) -> None:
+    """Drop the cached entry (kind, key), or every entry of that kind when key is None."""
+    if key is not None:
+        _lookup_cache.pop((kind, key), None)
+        return
+    for cached_key in [k for k in _lookup_cache if k[0] == kind]:
+        _lookup_cache.pop(cached_key, None)
+
+
+def invalidate_artwork_metadata(inventory_numbers=None) -> None:
+    """Forget cached get_artwork_metadata results, e.g. after writing new captions for these artworks.
+
+    Without inventory_numbers all cached metadata is dropped.
+    """
+    if inventory_numbers is None:
+        _lookup_invalidate("metadata")
+        return
+    for inventory_number in inventory_numbers:
+        _lookup_invalidate("metadata", inventory_number)
+
+# One Supabase client per process, shared by all SupabaseClient instances
+_client: Optional[Client] = None
+# The httpx client behind it, kept for close_clients()
+_http_client: Optional[httpx.Client] = None
+
+
+def _pool_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=SUPABASE_MAX_CONNECTIONS,
+        max_keepalive_connections=SUPABASE_MAX_KEEPALIVE,
+        keepalive_expiry=SUPABASE_KEEPALIVE_EXPIRY,
+    )
+
+
+def _timeout() -> httpx.Timeout:
+    # Fail fast on connect / pool exhaustion, keep the long read timeout for large RPCs (vector_search)
+    return httpx.Timeout(SUPABASE_TIMEOUT, connect=SUPABASE_CONNECT_TIMEOUT, pool=SUPABASE_CONNECT_TIMEOUT)
+
+
+def _get_client(url: str, key: str) -> Client:
+    """Create the shared Supabase client on first use (one HTTP/2 connection pool per process)."""
+    global _client, _http_client
+    if _client is None:
+        _http_client = httpx.Client(
+            follow_redirects=True,
+            timeout=_timeout(),
+            # HTTP/2 + pool limits live on the transport; failed connection attempts are retried once
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=1,
+                limits=_pool_limits(),
+            ),
+        )
+        _client = create_client(url, key, options=ClientOptions(httpx_client=_http_client))
+    return _client
+
+
+async def close_clients() -> None:
+    """Close the pooled connections of the shared client (app shutdown hook)."""
+    global _client, _http_client
+    if _http_client is not None:
+        _http_client.close()
+    _client = _http_client = None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_llm_client() -> LLMClient:
+    """Shared LLMClient for query embeddings (vector_search), created on first use."""
+    return LLMClient()
+
+
+# Mock analytics generators (Insights page). The date range is fixed, so results are
+# memoized per argument set: dashboard refreshes don't regenerate the data.
+# Treat the returned lists/dicts as read-only.
+
+_MOCK_USERS = ('Dieter', 'Lies', 'Karine', 'Lara', 'Wouter', 'Roxanne')
+
+# Fixed date range: Dec 1, 2025 to Feb 9, 2026 (70 days); labels are built once
+# (date ordinals + isoformat() instead of timedelta arithmetic + strftime)
+_MOCK_START_ORD = date(2025, 12, 1).toordinal()
+_MOCK_TOTAL_DAYS = date(2026, 2, 9).toordinal() - _MOCK_START_ORD + 1
+_MOCK_DAY_LABELS = tuple(date.fromordinal(_MOCK_START_ORD + i).isoformat() for i in range(_MOCK_TOTAL_DAYS))
+_MOCK_WEEK_LABELS = tuple(date.fromordinal(_MOCK_START_ORD + 7 * i).strftime('Week %W') for i in range(_MOCK_TOTAL_DAYS // 7))
+_MOCK_MONTH_LABELS = ('December 2025', 'January 2026', 'February 2026')
+
+# Seeded once; all mock series are drawn in vectorized calls
+_MOCK_RNG = np.random.default_rng(42)
+
+# Per period: (low, high) bounds per column, inclusive. Month bounds are per month (Feb is a half month).
+_TAG_ACTIVITY_COLUMNS = ('created', 'deleted', 'promoted', 'demoted')
+_TAG_ACTIVITY_BOUNDS = {
+    'day': ((10, 0, 5, 0), (50, 15, 25, 10)),
+    'week': ((100, 10, 50, 10), (300, 80, 150, 60)),
+    'month': (
+        ((400, 50, 200, 50), (400, 50, 200, 50), (200, 25, 100, 25)),
+        ((1200, 300, 600, 250), (1200, 300, 600, 250), (600, 150, 300, 125)),
+    ),
+}
+
+_LLM_STATISTICS_COLUMNS = ('api_calls', 'tokens_used')
+_LLM_STATISTICS_BOUNDS = {
+    'day': ((50, 5000), (200, 25000)),
+    'week': ((500, 50000), (1400, 180000)),
+    'month': (
+        ((2000, 200000), (2000, 200000), (1000, 100000)),
+        ((6000, 750000), (6000, 750000), (3000, 375000)),
+    ),
+}
+
+# Contribution count buckets: 0, 1-5, 5-15, 15-40 (some days without activity)
+_CONTRIBUTION_WEIGHTS = (0.3, 0.4, 0.2, 0.1)
+_CONTRIBUTION_LOW = np.array([0, 1, 5, 15])
+_CONTRIBUTION_HIGH = np.array([0, 5, 15, 40])
+
+
+def _mock_series(period: str, days: int, columns: tuple, bounds: dict) -> List[Dict]:
+    """Random {date, <columns>} rows for a 'day', 'week' or 'month' period, drawn in one call."""
+    if period == 'day':
+        labels = _MOCK_DAY_LABELS[:min(days, _MOCK_TOTAL_DAYS)]
+    elif period == 'week':
+        labels = _MOCK_WEEK_LABELS[:min(days // 7, len(_MOCK_WEEK_LABELS))]
+    else:  # month
+        labels = _MOCK_MONTH_LABELS
+        period = 'month'
+    low, high = bounds[period]
+    values = _MOCK_RNG.integers(low, np.asarray(high) + 1, size=(len(labels), len(columns)))
+    keys = ('date',) + columns
+    return [dict(zip(keys, (label, *row))) for label, row in zip(labels, values.tolist())]
+
+
+@functools.lru_cache(maxsize=32)
+def _tag_activity_impl(period: str, days: int) -> List[Dict]:
+    return _mock_series(period, days, _TAG_ACTIVITY_COLUMNS, _TAG_ACTIVITY_BOUNDS)
+
+
+@functools.lru_cache(maxsize=32)
+def _user_contributions_impl(days: int) -> Dict:
+    buckets = _MOCK_RNG.choice(len(_CONTRIBUTION_WEIGHTS), size=(len(_MOCK_USERS), _MOCK_TOTAL_DAYS),
+                               p=_CONTRIBUTION_WEIGHTS)
+    counts = _MOCK_RNG.integers(_CONTRIBUTION_LOW[buckets], _CONTRIBUTION_HIGH[buckets] + 1).tolist()
+    return {
+        'dates': list(_MOCK_DAY_LABELS),
+        'users': dict(zip(_MOCK_USERS, counts)),
+    }
+
+
+@functools.lru_cache(maxsize=32)
+def _llm_statistics_impl(period: str, days: int) -> List[Dict]:
+    return _mock_series(period, days, _LLM_STATISTICS_COLUMNS, _LLM_STATISTICS_BOUNDS)
+
+
+# Real tag names from KMSKB (only meaningful tags)
+_MOCK_TAGS = (
+    'naakt', 'man', 'vrouw', 'figuur', 'interieur', 'profiel', 'water', 'zeilboot', 
+    'officieel bezoek', 'oever', 'Schelde', 'bezoek', 'brug', 'koe', 'Maria de\' Medici', 
+    'Antwerpen', 'scene', 'omwalling', 'Sint-Walburgiskerk', 'Sint-Andrieskerk', 
+    'Vlaams Hoofd', 'dier', 'Sint-Michielsabdij', 'huis', 'stroom', 'toeschouwer', 
+    'stad', 'groet', 'toren', 'Onze-Lieve-Vrouwekathedraal', 'vlotten', 'kanon', 
+    'Isabella Clara Eugenia', 'cirkel', 'steen', 'gebed', 'kind', 'kerk', 'buste', 
+    'portret', 'hand', 'open', 'deur', 'naaktheid', 'ten voeten uit', 'samengevoegd', 
+    'kunstenaar', 'ten halven lijve', 'Carel de Moor', 'zelfportret'
+)
+
+# Realistic distribution, drawn once: some tags very common (first 10), most rare
+_MOCK_TAG_INDEX = np.arange(len(_MOCK_TAGS))
+_MOCK_TAG_COUNTS = _MOCK_RNG.integers(
+    np.select([_MOCK_TAG_INDEX < 10, _MOCK_TAG_INDEX < 25], [800, 200], 50),
+    np.select([_MOCK_TAG_INDEX < 10, _MOCK_TAG_INDEX < 25], [2000, 800], 200) + 1,
+).tolist()
+
+
+@functools.lru_cache(maxsize=32)
+def _tag_distribution_impl(page: int, page_size: int) -> Dict:
+    total_tags = len(_MOCK_TAGS)
+    start_idx = (page - 1) * page_size
+    end_idx = min(start_idx + page_size, total_tags)
+
+    return {
+        'tags': list(_MOCK_TAGS[start_idx:end_idx]),
+        'counts': _MOCK_TAG_COUNTS[start_idx:end_idx],
+        'total_tags': total_tags,
+        'current_page': page,
+        'total_pages': (total_tags + page_size - 1) // page_size
+    }
+
+
 class SupabaseClient:
     """Handles all Supabase database interactions."""
 
@@ -13,6 +249,7 @@ class SupabaseClient:
     TABLE_TAGS = "tags"
     TABLE_ARTWORK_TAGS = "artwork-tags"
     VIEW_ARTWORK_WITH_TAGS = "artwork_with_tags_view"
+    TABLE_ROW_COUNTS = "row_counts"
 
     # Configureerbare zoekvelden
     SEARCH_FIELDS = {
@@ -22,14 +259,29 @@ class SupabaseClient:
             'beschrijving_titel',
             'imageOpacLink'
         ],
+        'search': [
+            'inventarisnummer',
+            'beschrijving_kunstenaar',
+            'kunstenaar_voornaam',
+            'kunstenaar_familienaam',
+            'beschrijving_titel',
+            'beschrijving_datering',
+            'imageOpacLink',
+            'linkToVubis'
+        ],
     }
+    # Select strings, built once
+    _BASIC_SELECT = ",".join(SEARCH_FIELDS['basic'])
+    _SEARCH_SELECT = ",".join(SEARCH_FIELDS['search'])
+
+    # Default cap on search_artworks results (PostgREST's default max-rows)
+    SEARCH_MAX_RESULTS = 1000
     
     
     def __init__(self):
-        load_dotenv()
         # Try FABRITIUS_ prefix first, fallback to direct name
-        self.url = os.getenv("FABRITIUS_SUPABASE_URL") or os.getenv("SUPABASE_URL")
-        self.key = os.getenv("FABRITIUS_SUPABASE_KEY") or os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+        self.url = os.environ.get("FABRITIUS_SUPABASE_URL") or os.environ.get("SUPABASE_URL")
+        self.key = os.environ.get("FABRITIUS_SUPABASE_KEY") or os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
         
         if not self.url or not self.key:
             raise ValueError(
@@ -39,36 +291,88 @@ class SupabaseClient:
                 "Create a .env file in the project root with these values."
             )
         
-        self.client: Client = create_client(self.url, self.key)
+        self.client: Client = _get_client(self.url, self.key)
     
+    def _exec(self, query, retries: int = DB_RETRIES):
+        """Execute a read query, retrying transient transport errors with jittered exponential backoff.
+
+        Covers connect/pool timeouts, refused connections and dropped connections (e.g. a pooler
+        restart), which would otherwise fail a whole page render. Read timeouts are not retried:
+        a slow query (e.g. vector_search) would block the caller for several times SUPABASE_TIMEOUT.
+        Only used for reads: a timed-out write may have been applied, so retrying it isn't safe.
+        API errors (4xx/5xx responses) are not retried.
+        """
+        for attempt in range(retries):
+            try:
+                return query.execute()
+            except _TRANSIENT_ERRORS as e:
+                if attempt == retries - 1:
+                    raise
+                delay = DB_RETRY_BACKOFF * (2 ** attempt) * random.uniform(0.5, 1.5)
+                logger.warning(f"Transient database error ({type(e).__name__}), retry {attempt + 1} in {delay:.2f}s")
+                time.sleep(delay)
+
     # Analytics / Insights methods (mockup data for now)
     
     def get_total_artworks(self) -> int:
         """Get total number of artworks in database.
         
         Returns:
-            Total artwork count (currently mockup: 12,375)
+            Total artwork count (from the row_counts table or an estimate, mockup 12,375 if unavailable)
         """
-        # TODO: Replace with actual query: self.client.table(self.TABLE_FABRITIUS).select("count", count="exact").execute().count
-        return 12375
+        return self._row_count(self.TABLE_FABRITIUS, fallback=12375)
     
     def get_unique_tags_count(self) -> int:
         """Get number of unique tags in database.
         
         Returns:
-            Unique tags count (currently mockup: 4,597)
+            Unique tags count (from the row_counts table or an estimate, mockup 4,597 if unavailable)
         """
-        # TODO: Replace with actual query: self.client.table(self.TABLE_TAGS).select("count", count="exact").execute().count
-        return 4597
+        return self._row_count(self.TABLE_TAGS, fallback=4597)
     
     def get_assigned_tags_count(self) -> int:
         """Get total number of tag assignments (artwork-tag relationships).
         
         Returns:
-            Total assigned tags count (currently mockup: 63,200)
+            Total assigned tags count (from the row_counts table or an estimate, mockup 63,200 if unavailable)
+        """
+        return self._row_count(self.TABLE_ARTWORK_TAGS, fallback=63200)
+
+    def _row_count(self, table_name: str, fallback: int) -> int:
+        """Row count of a table from the trigger-maintained row_counts table (sql/row_counts.sql).
+
+        A single-row primary key lookup instead of count(*) over the table, cached in-process
+        for ROW_COUNT_TTL seconds. Without the counter (row_counts table or trigger not installed)
+        it falls back to an estimated count of the table itself, and only returns the mock fallback
+        if that fails too.
         """
-        # TODO: Replace with actual query: self.client.table(self.TABLE_ARTWORK_TAGS).select("count", count="exact").execute().count
-        return 63200
+        cached = _row_count_cache.get(table_name)
+        now = time.monotonic()
+        if cached and now - cached[0] < ROW_COUNT_TTL:
+            return cached[1]
+        try:
+            response = self._exec(self.client
+                       .table(self.TABLE_ROW_COUNTS)
+                       .select("n")
+                       .eq("table_name", table_name)
+                       .single())
+            n = response.data["n"]
+        except Exception as e:
+            logger.warning(f"Failed to read row count for {table_name} from {self.TABLE_ROW_COUNTS}, "
+                           f"using an estimated count (is sql/row_counts.sql installed?): {e}")
+            try:
+                response = self._exec(self.client
+                           .table(table_name)
+                           .select("*", count="estimated", head=True))
+                n = response.count
+            except Exception as e:
+                n = None
+                logger.warning(f"Failed to count rows of {table_name}: {e}")
+            if n is None:
+                logger.warning(f"No row count for {table_name}, returning mock value {fallback}")
+                return fallback
+        _row_count_cache[table_name] = (now, n)
+        return n
     
     def get_tag_activity(self, period: str = 'day', days: int = 30) -> List[Dict]:
         """Get tag activity over time (created, deleted, promoted, demoted).
@@ -81,99 +385,20 @@ class SupabaseClient:
             List of dicts with date, created, deleted, promoted, demoted counts (mockup data)
         """
         # TODO: Replace with actual query from tag history/audit table
-        from datetime import datetime, timedelta
-        import random
-        
-        # Fixed date range: Dec 1, 2025 to Feb 9, 2026 (70 days)
-        start_date = datetime(2025, 12, 1)
-        end_date = datetime(2026, 2, 9)
-        total_days = (end_date - start_date).days + 1
-        
-        data = []
-        
-        if period == 'day':
-            num_days = min(days, total_days)
-            for i in range(num_days):
-                date = start_date + timedelta(days=i)
-                data.append({
-                    'date': date.strftime('%Y-%m-%d'),
-                    'created': random.randint(10, 50),
-                    'deleted': random.randint(0, 15),
-                    'promoted': random.randint(5, 25),
-                    'demoted': random.randint(0, 10)
-                })
-        elif period == 'week':
-            num_weeks = min(days // 7, total_days // 7)
-            for i in range(num_weeks):
-                date = start_date + timedelta(weeks=i)
-                data.append({
-                    'date': date.strftime('Week %W'),
-                    'created': random.randint(100, 300),
-                    'deleted': random.randint(10, 80),
-                    'promoted': random.randint(50, 150),
-                    'demoted': random.randint(10, 60)
-                })
-        else:  # month
-            # Dec 2025, Jan 2026, Feb 2026
-            data.append({
-                'date': 'December 2025',
-                'created': random.randint(400, 1200),
-                'deleted': random.randint(50, 300),
-                'promoted': random.randint(200, 600),
-                'demoted': random.randint(50, 250)
-            })
-            data.append({
-                'date': 'January 2026',
-                'created': random.randint(400, 1200),
-                'deleted': random.randint(50, 300),
-                'promoted': random.randint(200, 600),
-                'demoted': random.randint(50, 250)
-            })
-            data.append({
-                'date': 'February 2026',
-                'created': random.randint(200, 600),
-                'deleted': random.randint(25, 150),
-                'promoted': random.randint(100, 300),
-                'demoted': random.randint(25, 125)
-            })
-        
-        return data
+        return _tag_activity_impl(period, days)
     
-    def get_user_contributions(self, days: int = 90) -> Dict[str, List[Dict]]:
+    def get_user_contributions(self, days: int = 90) -> Dict:
         """Get user contribution activity (GitHub-style calendar data).
         
         Args:
             days: Number of days to look back
             
         Returns:
-            Dict mapping usernames to list of {date, count} contributions (mockup data)
+            Columnar dict (mockup data): {'dates': [date, ...], 'users': {username: [count, ...]}},
+            where each user's counts line up with 'dates'
         """
         # TODO: Replace with actual query from tag history/audit table grouped by user
-        from datetime import datetime, timedelta
-        import random
-        
-        # Fixed date range: Dec 1, 2025 to Feb 9, 2026 (70 days)
-        start_date = datetime(2025, 12, 1)
-        end_date = datetime(2026, 2, 9)
-        total_days = (end_date - start_date).days + 1
-        
-        users = ['Dieter', 'Lies', 'Karine', 'Lara', 'Wouter', 'Roxanne']
-        
-        contributions = {}
-        for user in users:
-            user_data = []
-            for i in range(total_days):
-                date = start_date + timedelta(days=i)
-                # Random contributions with some days having 0 (realistic pattern)
-                count = random.choices([0, random.randint(1, 5), random.randint(5, 15), random.randint(15, 40)], 
-                                      weights=[0.3, 0.4, 0.2, 0.1])[0]
-                user_data.append({
-                    'date': date.strftime('%Y-%m-%d'),
-                    'count': count
-                })
-            contributions[user] = user_data
-        
-        return contributions
+        return _user_contributions_impl(days)
     
     def get_llm_statistics(self, period: str = 'day', days: int = 30) -> List[Dict]:
         """Get LLM usage statistics (API calls and token consumption).
@@ -186,83 +411,42 @@ class SupabaseClient:
             List of dicts with date, api_calls, tokens_used (mockup data)
         """
         # TODO: Replace with actual query from LLM usage logs/metrics table
-        from datetime import datetime, timedelta
-        import random
-        
-        # Fixed date range: Dec 1, 2025 to Feb 9, 2026 (70 days)
-        start_date = datetime(2025, 12, 1)
-        end_date = datetime(2026, 2, 9)
-        total_days = (end_date - start_date).days + 1
-        
-        data = []
-        
-        if period == 'day':
-            num_days = min(days, total_days)
-            for i in range(num_days):
-                date = start_date + timedelta(days=i)
-                data.append({
-                    'date': date.strftime('%Y-%m-%d'),
-                    'api_calls': random.randint(50, 200),
-                    'tokens_used': random.randint(5000, 25000)
-                })
-        elif period == 'week':
-            num_weeks = min(days // 7, total_days // 7)
-            for i in range(num_weeks):
-                date = start_date + timedelta(weeks=i)
-                data.append({
-                    'date': date.strftime('Week %W'),
-                    'api_calls': random.randint(500, 1400),
-                    'tokens_used': random.randint(50000, 180000)
-                })
-        else:  # month
-            # Dec 2025, Jan 2026, Feb 2026
-            data.append({
-                'date': 'December 2025',
-                'api_calls': random.randint(2000, 6000),
-                'tokens_used': random.randint(200000, 750000)
-            })
-            data.append({
-                'date': 'January 2026',
-                'api_calls': random.randint(2000, 6000),
-                'tokens_used': random.randint(200000, 750000)
-            })
-            data.append({
-                'date': 'February 2026',
-                'api_calls': random.randint(1000, 3000),
-                'tokens_used': random.randint(100000, 375000)
-            })
-        
-        return data
+        return _llm_statistics_impl(period, days)
     
     def search_artworks_by_tag(self, tag_query: str, limit: int = 10) -> List[Dict]:
         """Search artworks that contain a specific tag.
+
+        Single query on VIEW_ARTWORK_WITH_TAGS (the artwork-tags/tags/fabritius join runs in the
+        database); the ILIKE on label is served by the trigram index on tags.label (sql/create_indexes.sql).
         
         Args:
             tag_query: Tag name to search for (partial match)
             limit: Maximum number of results to return
             
         Returns:
-            List of artwork dicts with tag information (mockup data)
+            List of artwork dicts with tag information
+            (inventarisnummer, beschrijving_kunstenaar, beschrijving_titel, tag_name, provenance)
         """
-        # TODO: Replace with actual query joining artwork-tags, tags, and fabritius tables
-        import random
-        
-        # Mock data - in reality would query VIEW_ARTWORK_WITH_TAGS or join tables
-        artists = ['Peter Paul Rubens', 'Pieter Bruegel', 'René Magritte', 'James Ensor', 'Anthony van Dyck']
-        centuries = ['15th', '16th', '17th', '18th', '19th', '20th']
-        
-        results = []
-        for i in range(limit):
-            results.append({
-                'inventarisnummer': f'INV-{random.randint(1000, 9999)}',
-                'beschrijving_kunstenaar': random.choice(artists),
-                'beschrijving_titel': f'Artwork Title {i+1}',
-                'tag_name': tag_query,
-                'tag_level': random.randint(1, 3),
-                'confidence': round(random.uniform(0.7, 0.99), 2)
-            })
-        
-        return results
+        try:
+            response = self._exec(self.client
+                       .table(self.VIEW_ARTWORK_WITH_TAGS)
+                       .select("inventarisnummer,beschrijving_kunstenaar,beschrijving_titel,label,provenance")
+                       .ilike("label", f"%{tag_query}%")
+                       .limit(limit))
+            return [
+                {
+                    'inventarisnummer': row['inventarisnummer'],
+                    'beschrijving_kunstenaar': row['beschrijving_kunstenaar'],
+                    'beschrijving_titel': row['beschrijving_titel'],
+                    'tag_name': row['label'],
+                    'provenance': row['provenance']
+                }
+                for row in response.data or []
+            ]
+
+        except Exception as e:
+            logger.error(f"Error searching artworks by tag '{tag_query}': {e}")
+            return []
     
     def get_tag_distribution(self, page: int = 1, page_size: int = 100) -> Dict:
         """Get tag distribution with occurrence counts (paginated).
@@ -276,80 +460,45 @@ class SupabaseClient:
         """
         # TODO: Replace with actual query grouping by tag and counting artworks
         # SELECT tag_name, COUNT(*) as count FROM artwork_tags GROUP BY tag_name ORDER BY count DESC
-        import random
-        
-        # Real tag names from KMSKB (only meaningful tags)
-        all_tags = [
-            'naakt', 'man', 'vrouw', 'figuur', 'interieur', 'profiel', 'water', 'zeilboot', 
-            'officieel bezoek', 'oever', 'Schelde', 'bezoek', 'brug', 'koe', 'Maria de\' Medici', 
-            'Antwerpen', 'scene', 'omwalling', 'Sint-Walburgiskerk', 'Sint-Andrieskerk', 
-            'Vlaams Hoofd', 'dier', 'Sint-Michielsabdij', 'huis', 'stroom', 'toeschouwer', 
-            'stad', 'groet', 'toren', 'Onze-Lieve-Vrouwekathedraal', 'vlotten', 'kanon', 
-            'Isabella Clara Eugenia', 'cirkel', 'steen', 'gebed', 'kind', 'kerk', 'buste', 
-            'portret', 'hand', 'open', 'deur', 'naaktheid', 'ten voeten uit', 'samengevoegd', 
-            'kunstenaar', 'ten halven lijve', 'Carel de Moor', 'zelfportret'
-        ]
-        
-        total_tags = len(all_tags)
-        start_idx = (page - 1) * page_size
-        end_idx = min(start_idx + page_size, total_tags)
-        
-        tags = []
-        counts = []
-        
-        for i in range(start_idx, end_idx):
-            tags.append(all_tags[i])
-            # Realistic distribution: some tags very common, most rare
-            if i < 10:
-                count = random.randint(800, 2000)
-            elif i < 25:
-                count = random.randint(200, 800)
-            else:
-                count = random.randint(50, 200)
-            counts.append(count)
-        
-        return {
-            'tags': tags,
-            'counts': counts,
-            'total_tags': total_tags,
-            'current_page': page,
-            'total_pages': (total_tags + page_size - 1) // page_size
-        }
-        
-    def get_artworks(self, page: int = 1, items_per_page: int = 12, search_params: dict = None) -> List[Dict]:
+        return _tag_distribution_impl(page, page_size)
+    
+    def get_artworks(self, page: int = 1, items_per_page: int = 12, search_params: dict = None,
+                     count_mode: str = "estimated") -> List[Dict]:
         """Fetch artworks with pagination and optional search filters.
     
         Implementation details:
-        1. First gets total count for pagination
-        2. Then fetches actual data for current page
-        3. Handles both regular and semantic search through search_params
+        1. Fetches the data for the current page and the total count in one request
+           (PostgREST returns the count in the Content-Range header)
+        2. Handles both regular and semantic search through search_params
         
         Args:
             page: Current page number (1-based)
             items_per_page: Number of items per page
             search_params: Optional filters for inventory number, artist, title
                         For semantic search, inventory_number will be a list
+            count_mode: PostgREST count method for the total ("planned", "estimated" or "exact").
+                        "estimated" (default) counts exactly up to PostgREST's max-rows and uses
+                        the query planner estimate (no table scan) above it; pass "exact" when
+                        the UI needs the precise total. Semantic search always counts exactly.
         """
         try:
             # Calculate pagination bounds
             start = (page - 1) * items_per_page
             end = start + items_per_page - 1
 
+            if search_params and isinstance(search_params.get('inventory_number'), list):
+                count_mode = "exact"
 
-            # Get total count with filters
-            count_query = self.client.table(self.TABLE_FABRITIUS).select("count", count="exact")
-            if search_params:
-                count_query = self._apply_search_filters(count_query, search_params)
-            count_response = count_query.execute()
-            total_items = count_response.count
-            total_pages = (total_items + items_per_page - 1) // items_per_page
-
-            # Get data for current page
-            data_query = self.client.table(self.TABLE_FABRITIUS).select(",".join(self.SEARCH_FIELDS['basic']))
+            # Get data for current page, total count with filters comes along
+            data_query = self.client.table(self.TABLE_FABRITIUS).select(
+                self._BASIC_SELECT, count=count_mode
+            )
             if search_params:
                 data_query = self._apply_search_filters(data_query, search_params)
         
-            response = data_query.range(start, end).execute()
+            response = self._exec(data_query.range(start, end))
+            total_items = response.count or 0
+            total_pages = (total_items + items_per_page - 1) // items_per_page
                         
             logger.info(f"Retrieved {len(response.data)} artworks of {total_items} total")
             
@@ -377,96 +526,141 @@ class SupabaseClient:
         2. Semantic search: Uses IN with list of inventory numbers from vector similarity
         
         Other fields use ILIKE for partial text matching.
+        Errors (e.g. a malformed year_range) propagate to the caller (get_artworks logs them).
         """
-        try:
-            #logger.debug(f"Applying search filters: {search_params}")
+        #logger.debug(f"Applying search filters: {search_params}")
+        
+        if inv_nr := search_params.get('inventory_number'):
             
-            if inv_nr := search_params.get('inventory_number'):
-                
-                # Vector search results come as a list of inventory numbers
-                if isinstance(inv_nr, list):
-                    # For semantic search results
-                    query = query.in_('inventarisnummer', inv_nr)
-                    logger.info(f"Vector search filter applied with {len(inv_nr)} matches")
-                
-                # Regular search uses partial text matching
-                else:
-                    query = query.ilike('inventarisnummer', f'%{inv_nr}%')
-                    logger.info(f"Regular inventory search: {inv_nr}")
+            # Vector search results come as a list of inventory numbers
+            if isinstance(inv_nr, list):
+                # For semantic search results
+                query = query.in_('inventarisnummer', inv_nr)
+                logger.info(f"Vector search filter applied with {len(inv_nr)} matches")
+            
+            # Regular search uses partial text matching
+            else:
+                query = query.ilike('inventarisnummer', f'%{inv_nr}%')
+                logger.info(f"Regular inventory search: {inv_nr}")
 
  
-            # Text search filters
-            if artist := search_params.get('artist'):
-                query = query.ilike('beschrijving_kunstenaar', f'%{artist}%')
-                logger.debug(f"Applied artist filter: {artist}")
-
-            if title := search_params.get('title'):
-                query = query.ilike('beschrijving_titel', f'%{title}%')
-                logger.debug(f"Applied title filter: {title}")
-            
-            # Year range filter (assuming beschrijving_datering contains year info)
-            if year_range := search_params.get('year_range'):
-                min_year, max_year = year_range
-                # Ensure integers (convert if needed)
-                if min_year is not None:
-                    min_year = int(min_year)
-                if max_year is not None:
-                    max_year = int(max_year)
-                # Note: beschrijving_datering might be text like "1642" or "ca. 1640-1650"
-                # For now, we'll do text-based filtering with ILIKE
-                # TODO: Consider parsing years from text for more accurate filtering
-                if min_year is not None:
-                    query = query.gte('beschrijving_datering', str(min_year))
-                if max_year is not None:
-                    query = query.lte('beschrijving_datering', str(max_year))
-                logger.debug(f"Applied year range filter: {min_year} - {max_year}")
-            
-            # Source filter (multiselect on collection source)
-            if source := search_params.get('source'):
-                if isinstance(source, list) and source:
-                    # Assuming there's a 'source' or 'collection' field
-                    # TODO: Verify actual field name in database
-                    query = query.in_('bron', source)
-                    logger.debug(f"Applied source filter: {source}")
-             
-            return query
+        # Text search filters
+        if artist := search_params.get('artist'):
+            query = query.ilike('beschrijving_kunstenaar', f'%{artist}%')
+            logger.debug(f"Applied artist filter: {artist}")
 
-        except Exception as e:
-            logger.error(f"Error applying search filters: {e}")
-            return query
+        if title := search_params.get('title'):
+            query = query.ilike('beschrijving_titel', f'%{title}%')
+            logger.debug(f"Applied title filter: {title}")
+        
+        # Year range filter (assuming beschrijving_datering contains year info)
+        if year_range := search_params.get('year_range'):
+            min_year, max_year = year_range
+            # Ensure integers (convert if needed)
+            if min_year is not None:
+                min_year = int(min_year)
+            if max_year is not None:
+                max_year = int(max_year)
+            # beschrijving_datering is text like "1642" or "ca. 1640-1650": filter on the
+            # indexed year_int column parsed from it instead (sql/create_indexes.sql)
+            if min_year is not None:
+                query = query.gte('year_int', min_year)
+            if max_year is not None:
+                query = query.lte('year_int', max_year)
+            logger.debug(f"Applied year range filter: {min_year} - {max_year}")
+        
+        # Source filter (multiselect on collection source)
+        if source := search_params.get('source'):
+            if isinstance(source, list) and source:
+                # Assuming there's a 'source' or 'collection' field
+                # TODO: Verify actual field name in database
+                query = query.in_('bron', source)
+                logger.debug(f"Applied source filter: {source}")
+         
+        return query
     
     def get_artwork_metadata(self, inventory_number: str) -> Optional[Dict]:
-        """Fetch full metadata for a single artwork."""
+        """Fetch the complete artwork record by inventory number (cached for LOOKUP_CACHE_TTL seconds).
+
+        Returns None if the artwork doesn't exist (maybe_single: no error on zero rows).
+        """
+        cached = _lookup_get(("metadata", inventory_number))
+        if cached is not _MISSING:
+            return cached
         try:
-            response = (self.client
+            response = self._exec(self.client
                        .table(self.TABLE_FABRITIUS)
                        .select("*")
                        .eq("inventarisnummer", inventory_number)
-                       .single()
-                       .execute())
+                       .maybe_single())
+            if response is None or response.data is None:
+                return None
+            _lookup_put(("metadata", inventory_number), response.data)
             return response.data
             
         except Exception as e:
             logger.error(f"Failed to fetch metadata for {inventory_number}: {e}")
             return None
-            
-    def search_artworks(self, 
-                       inventory_number: str = None,
-                       artist: str = None,
-                       title: str = None) -> List[Dict]:
-        """Search artworks based on criteria."""
-        try:
-            query = self.client.table(self.TABLE_FABRITIUS).select("*")
-            
+
+    def iter_search_artworks(self,
+                             inventory_number: str = None,
+                             artist: str = None,
+                             title: str = None,
+                             chunk_size: int = 500,
+                             limit: int = None) -> Iterator[Dict]:
+        """Stream artworks matching the criteria, chunk_size rows per request (at most limit rows).
+
+        Keyset pagination on inventarisnummer (no OFFSET, no count), so callers can stop
+        early and never hold the full result set. Only the SEARCH_FIELDS['search'] columns
+        are returned (no embeddings). The artist is matched on word prefixes of the first/last
+        name (search_by_artist RPC) rather than as a substring: "rub" finds Rubens, "ubens"
+        doesn't. Stops at the first empty chunk:
+        a short chunk may also come from PostgREST's max-rows limit.
+        Raises ValueError without any criterion: use get_artworks to page through everything.
+        """
+        artist = artist.strip() if artist else None
+        if not (inventory_number or artist or title):
+            raise ValueError("iter_search_artworks needs at least one search criterion")
+
+        last_inv = None
+        remaining = limit
+        while remaining is None or remaining > 0:
+            if artist:
+                # Full-text match on the indexed artist_tsv column (sql/stored_procedures.sql)
+                query = self.client.rpc("search_by_artist", {"q": artist}).select(self._SEARCH_SELECT)
+            else:
+                query = self.client.table(self.TABLE_FABRITIUS).select(self._SEARCH_SELECT)
+
             if inventory_number:
                 query = query.ilike("inventarisnummer", f"%{inventory_number}%")
-            if artist:
-                query = query.or_(f"kunstenaar_voornaam.ilike.%{artist}%,kunstenaar_familienaam.ilike.%{artist}%")
             if title:
                 query = query.ilike("beschrijving_titel", f"%{title}%")
-                
-            response = query.execute()
-            return response.data
+            if last_inv is not None:
+                query = query.gt("inventarisnummer", last_inv)
+
+            n = chunk_size if remaining is None else min(chunk_size, remaining)
+            rows = self._exec(query.order("inventarisnummer").limit(n)).data
+            if not rows:
+                return
+            yield from rows
+            last_inv = rows[-1]["inventarisnummer"]
+            if remaining is not None:
+                remaining -= len(rows)
+
+    def search_artworks(self, 
+                       inventory_number: str = None,
+                       artist: str = None,
+                       title: str = None,
+                       limit: int = SEARCH_MAX_RESULTS) -> List[Dict]:
+        """Search artworks based on criteria (at most limit matches as a list, see iter_search_artworks).
+
+        Returns [] when no criterion is given.
+        """
+        if not (inventory_number or (artist and artist.strip()) or title):
+            logger.warning("search_artworks called without search criteria")
+            return []
+        try:
+            return list(self.iter_search_artworks(inventory_number, artist, title, limit=limit))
             
         except Exception as e:
             logger.error(f"Search failed: {e}")
@@ -475,7 +669,8 @@ class SupabaseClient:
     def count_artworks(self) -> int:
         """Get total number of artworks in database."""
         try:
-            response = self.client.table(self.TABLE_FABRITIUS).select("count", count="exact").execute()
+            # HEAD request: the count comes from the Content-Range header, no body is returned
+            response = self._exec(self.client.table(self.TABLE_FABRITIUS).select("inventarisnummer", count="exact", head=True))
             return response.count
         except Exception as e:
             logger.error(f"Failed to count artworks: {e}")
@@ -494,18 +689,17 @@ class SupabaseClient:
         """
         try:
             # Generate embedding for query
-            llm = LLMClient()
-            query_embedding = llm.get_embedding(query_text)
+            query_embedding = _get_llm_client().get_embedding(query_text)
             
             if not query_embedding:
                 logger.error("Failed to generate embedding for query")
                 return []
             
             # Call stored procedure through RPC
-            response = (self.client.rpc('vector_search', {
+            response = self._exec(self.client.rpc('vector_search', {
                 'query_embedding': query_embedding,
                 'match_count': limit
-            }).execute())
+            }))
             
             return response.data if response.data else []
             
@@ -529,11 +723,10 @@ class SupabaseClient:
         """
         try:
             # First, get the artwork's embedding
-            artwork = self.client.table("fabritius")\
+            artwork = self._exec(self.client.table("fabritius")\
                 .select("caption_embedding")\
                 .eq('inventarisnummer', artwork_id)\
-                .limit(1)\
-                .execute()
+                .limit(1))
             
             if not artwork.data or not artwork.data[0].get('caption_embedding'):
                 logger.warning(f"No embedding found for artwork {artwork_id}")
@@ -542,10 +735,10 @@ class SupabaseClient:
             artwork_embedding = artwork.data[0]['caption_embedding']
             
             # Use existing match_iconographic_tags function with the embedding
-            response = self.client.rpc('match_iconographic_tags', {
+            response = self._exec(self.client.rpc('match_iconographic_tags', {
                 'query_embedding': artwork_embedding,
                 'match_count': limit
-            }).execute()
+            }))
             
             if not response.data:
                 return []
@@ -564,52 +757,41 @@ class SupabaseClient:
         except Exception as e:
             logger.error(f"Error recommending tags for artwork {artwork_id}: {e}")
             return []
-
     
-        
-
-    def get_artwork_by_inventory(self, inventory_number: str) -> dict:
-        """Fetch complete artwork record by inventory number."""
-        try:
-            response = (self.client.table("fabritius")
-                    .select("*")
-                    .eq('inventarisnummer', inventory_number)
-                    .limit(1)
-                    .execute())
-            
-            return response.data[0] if response.data else None
-            
-        except Exception as e:
-            logger.error(f"Error fetching artwork details: {e}")
-            return None
-    
-
 
     #get available tags in fabritius
     def get_all_tags_fabritius(self, batch_size: int = 1000) -> List[str]:
+        """Fetch all (non-null) tag labels.
 
-        all_data = []
-        offset = 0
-        column = "label"
+        Uses keyset pagination on id (WHERE id > last_id ORDER BY id LIMIT n): every batch is an
+        index range scan, unlike OFFSET paging which rescans all skipped rows. Batches stay at or
+        below PostgREST's max-rows limit, so a single unpaginated request/RPC would be truncated.
+        The list is cached for LOOKUP_CACHE_TTL seconds (cleared on tag writes).
+        """
+        cached = _lookup_get(("all_tags", None))
+        if cached is not _MISSING:
+            return cached
+
+        all_tags = []
+        last_id = None
 
         while True: 
-            #query with pagination
-            response = (
+            #query with keyset pagination; NULL labels are filtered server-side
+            query = (
                 self.client
                 .table(self.TABLE_TAGS)
-                .select(column)
-                .range(offset, offset + batch_size - 1)
-                .execute()
+                .select("id,label")
+                .not_.is_("label", "null")
             )
-
-            data = response.data
+            if last_id is not None:
+                query = query.gt("id", last_id)
+            data = self._exec(query.order("id").limit(batch_size)).data
             if not data:
                 break
-            all_data.extend(data)
-            offset += batch_size
+            all_tags.extend(row["label"] for row in data)
+            last_id = data[-1]["id"]
 
-        #FIXME: sometimes "label" key is missing or it has a none value
-        all_tags = [kv["label"] for kv in all_data if "label" in kv and kv["label"] is not None]
+        _lookup_put(("all_tags", None), all_tags)
         return all_tags
     
 
@@ -618,14 +800,13 @@ class SupabaseClient:
         Haal artworks die matchen met een bepaald label en een bepaalde provenance hebben.
         """
         #OLD: #.in_("label", labels) (multiselect)
-        query = (
+        query = self._exec(
             self.client
             .table(self.VIEW_ARTWORK_WITH_TAGS)
             .select("*")
             .eq("label", label)
             .eq("provenance", provenance)
             .limit(limit)
-            .execute()
         )
         return query.data if query.data else []
     
@@ -633,33 +814,37 @@ class SupabaseClient:
     def delete_tag_from_artworks(self, selected_ids):
         """
         Verwijder artwork-tag links
+
+        Alle geldige (inventarisnummer, tag_id) paren worden in één DELETE verwijderd
+        (RPC delete_artwork_tag_links, zie sql/stored_procedures.sql).
         """
         logger.debug(f"Geselecteerde werken/tags voor verwijdering: {selected_ids}")
-        
+
+        pairs = []
         for item in selected_ids:
             inventarisnummer = item.get('inventarisnummer', None)
-            tag = item.get('tag', None)
             tag_id = item.get('tag_id', None)
 
             if not inventarisnummer or not tag_id:
                 logger.warning(f"Ongeldig item, sla over [kan niet verwijderen]: {item}")
                 continue
+            pairs.append({"artwork_id": inventarisnummer, "tag_id": tag_id})
 
-            try:
-                response = (
-                    self.client
-                    .table(self.TABLE_ARTWORK_TAGS)
-                    .delete()
-                    .eq("artwork_id", inventarisnummer)
-                    .eq("tag_id", tag_id)
-                    .execute()
-                )
-                if response.data:
-                    logger.info(f"Verwijderde tag '{tag}' van werk '{inventarisnummer}'")
-                else:
-                    logger.error(f"Verwijderen mislukt voor tag '{tag}' van werk '{inventarisnummer}' (geen data terug)")
-            except Exception as e:
-                logger.error(f"Fout bij verwijderen tag '{tag}' van werk '{inventarisnummer}': {e}")
+        if not pairs:
+            return True
+
+        try:
+            response = self.client.rpc("delete_artwork_tag_links", {"pairs": pairs}).execute()
+            # Tag lookups are re-read after any tag write, including removed links
+            _lookup_invalidate("all_tags")
+            _lookup_invalidate("tag_id")
+            deleted = response.data or 0
+            if deleted:
+                logger.info(f"Verwijderde {deleted} van {len(pairs)} artwork-tag links")
+            if deleted < len(pairs):
+                logger.error(f"Verwijderen mislukt voor {len(pairs) - deleted} van {len(pairs)} artwork-tag links (niet gevonden)")
+        except Exception as e:
+            logger.error(f"Fout bij verwijderen van {len(pairs)} artwork-tag links: {e}")
         return True
     
     def insert_new_tag(self, label: str) -> bool:
@@ -674,10 +859,10 @@ class SupabaseClient:
                 .insert({"label": label})
                 .execute()
             )
+            _lookup_invalidate("all_tags")  # new label: cached tag list is stale
             return bool(response.data)
         except Exception as e:
-            # Optioneel: log de fout
-            print(f"Fout bij toevoegen tag: {e}")
+            logger.error(f"Fout bij toevoegen tag '{label}': {e}")
             return False
         
     def get_tags_for_artwork(self, inventarisnummer: str) -> list:
@@ -695,12 +880,11 @@ class SupabaseClient:
             ]
         """
         try:
-            response = (
+            response = self._exec(
                 self.client
                 .table("artwork_with_tags_view")
                 .select("tag_id, label, provenance")
                 .eq("inventarisnummer", inventarisnummer)
-                .execute()
             )
             return response.data if response.data else []
         except Exception as e:
@@ -710,36 +894,57 @@ class SupabaseClient:
     def get_artworks_with_tag(self, inventarisnummers: list, tag_label: str) -> set:
         """
         Geeft een set van inventarisnummers waarvoor de opgegeven tag al bestaat.
+        De doorsnede wordt in de database berekend (RPC artworks_having_tag, één distinct array).
         """
         if not inventarisnummers or not tag_label:
             return set()
-        response = (
-            self.client
-            .table("artwork_with_tags_view")
-            .select("inventarisnummer")
-            .in_("inventarisnummer", inventarisnummers)
-            .eq("label", tag_label)
-            .execute()
-        )
-        if response.data:
-            return set(row["inventarisnummer"] for row in response.data)
-        return set()
+        response = self._exec(self.client.rpc(
+            "artworks_having_tag", {"invs": list(inventarisnummers), "lbl": tag_label}
+        ))
+        return set(response.data) if response.data else set()
     
+    def apply_tag(self, inventarisnummer: str, label: str, provenance: str, create: bool = False) -> int | None:
+        """
+        Ken een label toe aan een werk in één round-trip (RPC apply_tag).
+        Zoekt het tag_id op en legt de artwork-tag link in dezelfde transactie; een bestaande link blijft ongewijzigd.
+        Met create=True wordt een onbekend label eerst aangemaakt in de tags-tabel.
+        Geeft het tag_id terug, of None als het label niet bestaat (en create=False) of bij een fout.
+        """
+        try:
+            response = self.client.rpc(
+                "apply_tag", {"_inv": inventarisnummer, "_label": label, "_prov": provenance, "_create": create}
+            ).execute()
+            if response.data is None:
+                logger.warning(f"Tag '{label}' bestaat niet in de tags-tabel, niet gekoppeld aan {inventarisnummer}")
+            elif create:
+                # The label may be new: cached tag list is stale
+                _lookup_invalidate("all_tags")
+                _lookup_invalidate("tag_id", label)
+            return response.data
+        except Exception as e:
+            logger.error(f"Fout bij toekennen tag '{label}' aan {inventarisnummer}: {e}")
+            return None
+
     def get_tagID_by_label(self, label: str) -> int | None:
         """
         Haal het tag_id op voor een gegeven label uit de tags-tabel.
         Geeft None terug als het label niet bestaat.
+        Gevonden ids worden LOOKUP_CACHE_TTL seconden gecached.
         """
-        response = (
+        cached = _lookup_get(("tag_id", label))
+        if cached is not _MISSING:
+            return cached
+        response = self._exec(
             self.client
             .table(self.TABLE_TAGS)
             .select("id")
             .eq("label", label)
             .limit(1)
-            .execute()
         )
         if response.data and len(response.data) > 0:
-            return response.data[0]["id"]
+            tag_id = response.data[0]["id"]
+            _lookup_put(("tag_id", label), tag_id)
+            return tag_id
         return None
     
 
@@ -762,8 +967,7 @@ class SupabaseClient:
             )
             return bool(response.data)
         except Exception as e:
-            # Optioneel: log de fout
-            print(f"Fout bij toevoegen artwork-tag link: {e}")
+            logger.error(f"Fout bij toevoegen artwork-tag link {inventarisnummer}/{tag_id}: {e}")
             return False
         
 
@@ -784,5 +988,15 @@ class SupabaseClient:
             )
             return bool(response.data)
         except Exception as e:
-            print(f"Fout bij promoten artwork-tag link: {e}")
-            return False
\ No newline at end of file
+            logger.error(f"Fout bij promoten artwork-tag link {inventarisnummer}/{tag_id}: {e}")
+            return False
+
+
+@functools.lru_cache(maxsize=1)
+def get_supabase_client() -> SupabaseClient:
+    """Return the process-wide SupabaseClient (created on first use).
+
+    Pages and operators use this instead of constructing a SupabaseClient per request.
+    Raises ValueError (and caches nothing) when the credentials are not configured.
+    """
+    return SupabaseClient()
@@ -7,6 +7,7 @@ This module provides environment-aware configuration management.
 Values can be overridden via environment variables or .env file.
 """
 
+import functools
 from typing import List, Dict, Any
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -96,22 +97,27 @@ class Settings(BaseSettings):
     openai_api_key: str = Field(default='', description='OpenAI API key')
 
 
-# Global settings instance (singleton pattern)
-# This is initialized once at module import and provides type-safe access
-# to configuration throughout the application
-settings = Settings()
-
-
-def get_settings():
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
     """
-    Get the global settings instance.
+    Get the global settings instance (singleton pattern).
     
-    This function is optional but provides:
-    - Explicit function call pattern (some teams prefer this)
-    - Easy to mock in tests
-    - Clear dependency in function signatures
+    Settings are built (and .env parsed) once, on first use instead of at import.
+    This function:
+    - Provides an explicit function call pattern (some teams prefer this)
+    - Can be reset in tests with get_settings.cache_clear(), but only for code that calls
+      get_settings() (or reads config.settings) on every use: modules that did
+      `from config import settings` keep the instance they imported
+    - Makes the dependency clear in function signatures
     
     Returns:
         Global Settings instance
     """
-    return settings
+    return Settings()
+
+
+def __getattr__(name: str):
+    """Lazy module attribute: `from config import settings` resolves to get_settings()."""
+    if name == 'settings':
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -137,54 +137,63 @@ Bulk Actions:
 Note: Algorithms are auto-registered when algorithm_registry.py is imported.
 This happens automatically - no manual registration needed.
 
+Note: The names below are resolved lazily (module __getattr__): a submodule is only
+imported when one of its names is first used.
+
 Note: ValidationEngine currently uses mock data (mock_data.py) for testing.
 Production implementation will integrate with backend/llms.py (embeddings) 
 and backend/supabase_client.py (vector similarity search).
 """
 
-from .state import LabelState, ValidationResults
-from .level_config import (
-    ValidationLevel, 
-    DEFAULT_LEVELS, 
-    get_enabled_levels, 
-    get_level_by_name,
-    VALIDATION_LEVEL_AI,
-    VALIDATION_LEVEL_HUMAN,
-    VALIDATION_LEVEL_EXPERT
-)
-from .thesaurus_registry import ThesaurusInfo, AVAILABLE_THESAURI, get_thesaurus_names, get_thesaurus_by_name
-from .algorithm_registry import AlgorithmInfo, AVAILABLE_ALGORITHMS, get_algorithm_names, get_algorithm_by_name
-from .label_service import LabelService
-from .validation_engine import ValidationEngine
+import importlib
 
-# Define what will be imported with 'from label_tool import *'
-__all__ = [
+# Public name -> submodule. Submodules are imported lazily on first attribute access
+# (PEP 562), so `import label_tool` (or one of its views) doesn't load all of them.
+_LAZY_ATTRS = {
     # State
-    'LabelState',
-    'ValidationResults',
-    
+    'LabelState': '.state',
+    'ValidationResults': '.state',
+
     # Level config
-    'ValidationLevel',
-    'DEFAULT_LEVELS',
-    'get_enabled_levels',
-    'get_level_by_name',
-    'VALIDATION_LEVEL_AI',
-    'VALIDATION_LEVEL_HUMAN',
-    'VALIDATION_LEVEL_EXPERT',
-    
+    'ValidationLevel': '.level_config',
+    'DEFAULT_LEVELS': '.level_config',
+    'get_enabled_levels': '.level_config',
+    'get_level_by_name': '.level_config',
+    'VALIDATION_LEVEL_AI': '.level_config',
+    'VALIDATION_LEVEL_HUMAN': '.level_config',
+    'VALIDATION_LEVEL_EXPERT': '.level_config',
+
     # Thesaurus
-    'ThesaurusInfo',
-    'AVAILABLE_THESAURI',
-    'get_thesaurus_names',
-    'get_thesaurus_by_name',
-    
+    'ThesaurusInfo': '.thesaurus_registry',
+    'AVAILABLE_THESAURI': '.thesaurus_registry',
+    'get_thesaurus_names': '.thesaurus_registry',
+    'get_thesaurus_by_name': '.thesaurus_registry',
+
     # Algorithms
-    'AlgorithmInfo',
-    'AVAILABLE_ALGORITHMS',
-    'get_algorithm_names',
-    'get_algorithm_by_name',
-    
+    'AlgorithmInfo': '.algorithm_registry',
+    'AVAILABLE_ALGORITHMS': '.algorithm_registry',
+    'get_algorithm_names': '.algorithm_registry',
+    'get_algorithm_by_name': '.algorithm_registry',
+
     # Services
-    'LabelService',
-    'ValidationEngine',
-]
+    'LabelService': '.label_service',
+    'ValidationEngine': '.validation_engine',
+}
+
+
+def __getattr__(name: str):
+    """Import the submodule that defines name on first use and cache the attribute."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+# Define what will be imported with 'from label_tool import *'
+__all__ = list(_LAZY_ATTRS)
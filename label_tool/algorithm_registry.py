@@ -8,17 +8,7 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 
-@dataclass
-class AlgorithmInfo:
-    """Information about a validation algorithm."""
-    id: str                    # Internal identifier
-    display_name: str          # Display name for UI
-    description: str           # Short description
-    requires_model: bool = False  # Whether this requires a loaded model
-    model_name: Optional[str] = None  # Model identifier if required
-
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AlgorithmInfo:
     """Information about a validation algorithm."""
     id: str                    # Internal identifier
@@ -45,6 +35,10 @@ AVAILABLE_ALGORITHMS = [
     ),
 ]
 
+# Lookup indexes, built once
+_BY_NAME = {a.display_name: a for a in AVAILABLE_ALGORITHMS}
+_BY_ID = {a.id: a for a in AVAILABLE_ALGORITHMS}
+
 
 def get_algorithm_names() -> List[str]:
     """Get list of algorithm display names for UI."""
@@ -53,22 +47,16 @@ def get_algorithm_names() -> List[str]:
 
 def get_algorithm_by_name(name: str) -> Optional[AlgorithmInfo]:
     """Get algorithm info by display name."""
-    for algorithm in AVAILABLE_ALGORITHMS:
-        if algorithm.display_name == name:
-            return algorithm
-    return None
+    return _BY_NAME.get(name)
 
 
 def get_algorithm_by_id(algorithm_id: str) -> Optional[AlgorithmInfo]:
     """Get algorithm info by ID."""
-    for algorithm in AVAILABLE_ALGORITHMS:
-        if algorithm.id == algorithm_id:
-            return algorithm
-    return None
+    return _BY_ID.get(algorithm_id)
 
 
 def get_enabled_algorithms(selected: List[str]) -> List[AlgorithmInfo]:
     """Get algorithm info for selected algorithms."""
-    return [get_algorithm_by_name(name) for name in selected if get_algorithm_by_name(name)]
+    return [a for a in (_BY_NAME.get(name) for name in selected) if a is not None]
 
 
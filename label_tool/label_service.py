@@ -2,12 +2,37 @@
 Label service for thesaurus operations.
 
 Handles API calls to thesaurus systems for label CRUD operations.
+Only search_labels / create_label will call a remote thesaurus API and are async;
+the point operations (get/update/delete) are plain methods.
 """
 
-from typing import Optional, Dict, Any, List
+import copy
+import time
+from typing import Optional, Dict, Any, List, Tuple
 from loguru import logger
 
 
+# Label lookups, shared by all LabelService instances (one is created per action):
+# (thesaurus_id, kind, key) -> (timestamp, value). Autocomplete queries recur within seconds.
+LABEL_CACHE_TTL = 60  # seconds
+LABEL_CACHE_MAXSIZE = 128
+_label_cache: Dict[Tuple[str, str, str], tuple] = {}
+
+
+def _cache_get(key: tuple):
+    """Copy of the cached value for key, or None if absent or older than LABEL_CACHE_TTL."""
+    cached = _label_cache.get(key)
+    if cached and time.monotonic() - cached[0] < LABEL_CACHE_TTL:
+        return copy.deepcopy(cached[1])  # callers may modify the labels they get back
+    return None
+
+
+def _cache_put(key: tuple, value) -> None:
+    if len(_label_cache) >= LABEL_CACHE_MAXSIZE:
+        _label_cache.pop(next(iter(_label_cache)))  # oldest entry (insertion order)
+    _label_cache[key] = (time.monotonic(), copy.deepcopy(value))
+
+
 class LabelService:
     """Service for interacting with thesaurus systems."""
     
@@ -25,20 +50,28 @@ class LabelService:
             
         Returns:
             List of matching labels with id, name, and definition
+            (cached for LABEL_CACHE_TTL seconds per exact query string)
         """
+        key = (self.thesaurus_id, "search", query)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+        
         logger.info(f"Searching labels in {self.thesaurus_id} with query: {query}")
         
         # TODO: Implement actual API call based on thesaurus type
         # For now, return mock data
-        return [
+        labels = [
             {
                 "id": "mock_1",
                 "name": query,
                 "definition": f"Mock definition for {query} in {self.thesaurus_id} thesaurus.",
             }
         ]
+        _cache_put(key, labels)
+        return labels
     
-    async def get_label(self, label_id: str) -> Optional[Dict[str, Any]]:
+    def get_label(self, label_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a specific label by ID.
         
@@ -48,11 +81,28 @@ class LabelService:
         Returns:
             Label data with id, name, and definition, or None if not found
         """
+        key = (self.thesaurus_id, "label", label_id)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+        
         logger.info(f"Getting label {label_id} from {self.thesaurus_id}")
         
-        # TODO: Implement actual API call based on thesaurus type
+        # TODO: Implement actual API call based on thesaurus type; _cache_put(key, label) when found
         return None
     
+    def invalidate(self, label_id: Optional[str] = None) -> None:
+        """
+        Drop cached lookups for this thesaurus after a mutation.
+        
+        Args:
+            label_id: Changed label; its lookup and all cached searches are dropped
+                      (None drops everything cached for this thesaurus)
+        """
+        for key in [k for k in _label_cache if k[0] == self.thesaurus_id]:
+            if label_id is None or key[1] == "search" or key[2] == label_id:
+                del _label_cache[key]
+    
     async def create_label(self, name: str, definition: str) -> Dict[str, Any]:
         """
         Create a new label in the thesaurus.
@@ -68,13 +118,15 @@ class LabelService:
         
         # TODO: Implement actual API call based on thesaurus type
         # For now, return mock data
-        return {
+        label = {
             "id": f"mock_{name.lower().replace(' ', '_')}",
             "name": name,
             "definition": definition,
         }
+        self.invalidate(label["id"])
+        return label
     
-    async def update_label(self, label_id: str, name: str, definition: str) -> Dict[str, Any]:
+    def update_label(self, label_id: str, name: str, definition: str) -> Dict[str, Any]:
         """
         Update an existing label.
         
@@ -89,13 +141,14 @@ class LabelService:
         logger.info(f"Updating label {label_id} in {self.thesaurus_id}")
         
         # TODO: Implement actual API call based on thesaurus type
+        self.invalidate(label_id)
         return {
             "id": label_id,
             "name": name,
             "definition": definition,
         }
     
-    async def delete_label(self, label_id: str) -> bool:
+    def delete_label(self, label_id: str) -> bool:
         """
         Delete a label from the thesaurus.
         
@@ -108,4 +161,5 @@ class LabelService:
         logger.info(f"Deleting label {label_id} from {self.thesaurus_id}")
         
         # TODO: Implement actual API call based on thesaurus type
+        self.invalidate(label_id)
         return True
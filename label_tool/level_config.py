@@ -4,17 +4,18 @@ Level configuration for label validation.
 Defines the validation levels (EXPERT, HUMAN, AI) and their properties.
 """
 
+import sys
 from dataclasses import dataclass
-from typing import List
+from typing import Tuple
 
 
-# Validation level constants (matching database values)
-VALIDATION_LEVEL_AI = "AI"
-VALIDATION_LEVEL_HUMAN = "HUMAN"
-VALIDATION_LEVEL_EXPERT = "EXPERT"
+# Validation level constants (matching database values), interned: used as box keys
+VALIDATION_LEVEL_AI = sys.intern("AI")
+VALIDATION_LEVEL_HUMAN = sys.intern("HUMAN")
+VALIDATION_LEVEL_EXPERT = sys.intern("EXPERT")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationLevel:
     """Configuration for a validation level."""
     name: str           # Internal name (e.g., "EXPERT")
@@ -53,15 +54,19 @@ DEFAULT_LEVELS = [
     ),
 ]
 
+# Lookup index and enabled levels in display order, built once
+_BY_NAME = {level.name: level for level in DEFAULT_LEVELS}
+_ENABLED_LEVELS = tuple(sorted((level for level in DEFAULT_LEVELS if level.enabled), key=lambda x: x.order))
 
-def get_enabled_levels() -> List[ValidationLevel]:
-    """Returns list of enabled validation levels in display order."""
-    return sorted([level for level in DEFAULT_LEVELS if level.enabled], key=lambda x: x.order)
+
+def get_enabled_levels() -> Tuple[ValidationLevel, ...]:
+    """Returns the enabled validation levels in display order."""
+    return _ENABLED_LEVELS
 
 
 def get_level_by_name(name: str) -> ValidationLevel:
     """Get level configuration by name."""
-    for level in DEFAULT_LEVELS:
-        if level.name == name:
-            return level
-    raise ValueError(f"Unknown validation level: {name}")
+    level = _BY_NAME.get(name)
+    if level is None:
+        raise ValueError(f"Unknown validation level: {name}")
+    return level
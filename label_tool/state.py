@@ -9,20 +9,40 @@ Box structure:
 """
 
 # dataclass: simplified class for managing data attributes; field: for default values
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 from .level_config import VALIDATION_LEVEL_AI, VALIDATION_LEVEL_HUMAN, VALIDATION_LEVEL_EXPERT
 
+# Box keys (fixed), in display order. Interned: box keys are dict/set keys everywhere in
+# this state, and dynamically built keys (f"AI-{algo}") are interned to the same objects.
+_AI_BOX_KEYS = (sys.intern("AI-Text"), sys.intern("AI-Multimodal"))
+_BOX_TO_ALGO = {key: key.split("-", 1)[1] for key in _AI_BOX_KEYS}  # "AI-Text" -> "Text"
+_VALIDATED_BOX_KEYS = (VALIDATION_LEVEL_AI, VALIDATION_LEVEL_HUMAN, VALIDATION_LEVEL_EXPERT)
 
-@dataclass
+
+def get_artwork_id(artwork: Dict[str, Any]) -> str:
+    """ID of an artwork result row (falls back to its inventory number)."""
+    return artwork['id'] if 'id' in artwork else artwork.get('inventory_number')
+
+
+@dataclass(slots=True)
 class ValidationResults:
     """Results for a single validation unit (algorithm or validation level)."""
     box_key: str                             # e.g., "AI-Text", "Human", "Expert"
     box_label: str                           # Display label
+    column_label: Optional[str] = None       # Column header override (set by ValidationEngine)
     results: List[Dict[str, Any]] = field(default_factory=list)  # Artwork results: field => default empty list
     total_count: int = 0                     # Total results for this box
     is_loading: bool = False                 # Whether results are being loaded
     error: Optional[str] = None              # Error message if loading failed
+
+    # Visible (non-hidden) results and their IDs, computed once per results list.
+    # Valid while results is the same list object: every update assigns a new list.
+    _visible_for: Optional[list] = field(default=None, init=False, repr=False, compare=False)
+    _visible: Tuple[Dict[str, Any], ...] = field(default=(), init=False, repr=False, compare=False)
+    _visible_ids: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
     
     def clear(self):
         """Clear all results."""
@@ -30,9 +50,26 @@ class ValidationResults:
         self.total_count = 0
         self.is_loading = False
         self.error = None
+        self._visible_for = None
+
+    def _refresh_visible(self):
+        if self._visible_for is not self.results:
+            self._visible = tuple(r for r in self.results if not r.get('_hidden', False))
+            self._visible_ids = tuple(get_artwork_id(r) for r in self._visible)
+            self._visible_for = self.results
+
+    def visible_results(self) -> Tuple[Dict[str, Any], ...]:
+        """All visible (non-hidden) artworks, in result order."""
+        self._refresh_visible()
+        return self._visible
 
+    def visible_ids(self) -> Tuple[str, ...]:
+        """IDs of all visible (non-hidden) artworks, in result order."""
+        self._refresh_visible()
+        return self._visible_ids
 
-@dataclass
+
+@dataclass(slots=True)
 class LabelState:
     """State for the label validation page."""
     
@@ -52,7 +89,7 @@ class LabelState:
     selected_levels: List[str] = field(default_factory=list)  # e.g., ["AI", "HUMAN", "EXPERT"]
     
     # Closed boxes (which boxes are hidden)
-    closed_boxes: List[str] = field(default_factory=list)  # e.g., ["AI-Multimodal", "Expert"]
+    closed_boxes: Set[str] = field(default_factory=set)  # e.g., {"AI-Multimodal", "Expert"}
     
     # Results per box (both AI algorithms and validated levels)
     # Keys: "AI-Text", "AI-Multimodal", "AI", "HUMAN", "EXPERT"
@@ -60,7 +97,11 @@ class LabelState:
     
     # Selected artworks per box (for bulk actions)
     # Keys: box_key, Values: set of artwork IDs
-    selected_artworks: Dict[str, set] = field(default_factory=dict)
+    selected_artworks: Dict[str, set] = field(default_factory=lambda: defaultdict(set))
+    
+    # Read-only snapshots of selected_artworks handed out by get_selected_artworks;
+    # a box's snapshot is dropped whenever its selection changes
+    _selection_snapshots: Dict[str, frozenset] = field(default_factory=dict, init=False, repr=False, compare=False)
     
     # Hidden artwork IDs (per box)
     hidden_artworks: Dict[str, set] = field(default_factory=dict)
@@ -71,6 +112,9 @@ class LabelState:
     # UI state
     is_searching: bool = False               # Whether search is in progress
     search_error: Optional[str] = None       # Error message if search failed
+
+    # Cached has_any_results() value; None = stale (see mark_results_dirty)
+    _any_results: Optional[bool] = field(default=None, init=False, repr=False, compare=False)
     
     def has_label(self) -> bool:
         """Check if a label is currently selected."""
@@ -87,33 +131,37 @@ class LabelState:
         """Clear results for all boxes."""
         for box_results in self.results_per_box.values():
             box_results.clear()
+        self._any_results = False
         self.is_searching = False
         self.search_error = None
     
     def get_box_results(self, box_key: str) -> ValidationResults:
         """Get results for a specific box."""
-        if box_key not in self.results_per_box:
-            self.results_per_box[box_key] = ValidationResults(
+        box_results = self.results_per_box.get(box_key)
+        if box_results is None:
+            # Created on first access only; the key is interned once, here
+            box_key = sys.intern(box_key)
+            box_results = self.results_per_box[box_key] = ValidationResults(
                 box_key=box_key,
                 box_label=box_key
             )
-        return self.results_per_box[box_key]
+        return box_results
     
-    def get_ai_box_keys(self) -> List[str]:
+    def get_ai_box_keys(self) -> Tuple[str, ...]:
         """Get all possible AI algorithm box keys (Text and Multimodal)."""
-        return ["AI-Text", "AI-Multimodal"]
+        return _AI_BOX_KEYS
     
-    def get_open_ai_box_keys(self) -> List[str]:
+    def get_open_ai_box_keys(self) -> Tuple[str, ...]:
         """Get AI algorithm box keys that are open (not closed)."""
-        return [key for key in self.get_ai_box_keys() if key not in self.closed_boxes]
+        return tuple(key for key in _AI_BOX_KEYS if key not in self.closed_boxes)
     
-    def get_validated_box_keys(self) -> List[str]:
+    def get_validated_box_keys(self) -> Tuple[str, ...]:
         """Get all validated level box keys."""
-        return [VALIDATION_LEVEL_AI, VALIDATION_LEVEL_HUMAN, VALIDATION_LEVEL_EXPERT]
+        return _VALIDATED_BOX_KEYS
     
-    def get_open_validated_box_keys(self) -> List[str]:
+    def get_open_validated_box_keys(self) -> Tuple[str, ...]:
         """Get validated level box keys that are open (not closed)."""
-        return [key for key in self.get_validated_box_keys() if key not in self.closed_boxes]
+        return tuple(key for key in _VALIDATED_BOX_KEYS if key not in self.closed_boxes)
     
     def is_box_open(self, box_key: str) -> bool:
         """Check if a box is open (not closed)."""
@@ -122,53 +170,58 @@ class LabelState:
     def toggle_box(self, box_key: str):
         """Toggle a box open/closed state."""
         if box_key in self.closed_boxes:
-            self.closed_boxes.remove(box_key)
+            self.closed_boxes.discard(box_key)
         else:
-            self.closed_boxes.append(box_key)
+            self.closed_boxes.add(box_key)
         
         # Sync selected algorithms for AI boxes
-        if box_key.startswith("AI-"):
-            algo_name = box_key.split("-", 1)[1]
+        algo_name = _BOX_TO_ALGO.get(box_key)
+        if algo_name is not None:
             if box_key in self.closed_boxes and algo_name in self.selected_algorithms:
                 self.selected_algorithms.remove(algo_name)
             elif box_key not in self.closed_boxes and algo_name not in self.selected_algorithms:
                 self.selected_algorithms.append(algo_name)
     
+    def mark_results_dirty(self):
+        """Call after changing a box's total_count (e.g. new search results, deletions)."""
+        self._any_results = None
+
     def has_any_results(self) -> bool:
-        """Check if any box has results."""
-        return any(box.total_count > 0 for box in self.results_per_box.values())
+        """Check if any box has results (rescans only after mark_results_dirty)."""
+        if self._any_results is None:
+            self._any_results = any(box.total_count > 0 for box in self.results_per_box.values())
+        return self._any_results
     
     # ========== Selection Management ==========
     
     def toggle_artwork_selection(self, box_key: str, artwork_id: str):
         """Toggle artwork selection in a box."""
-        if box_key not in self.selected_artworks:
-            self.selected_artworks[box_key] = set()
-        
-        if artwork_id in self.selected_artworks[box_key]:
-            self.selected_artworks[box_key].remove(artwork_id)
+        selected = self.selected_artworks[box_key]
+        if artwork_id in selected:
+            selected.remove(artwork_id)
         else:
-            self.selected_artworks[box_key].add(artwork_id)
+            selected.add(artwork_id)
+        self._selection_snapshots.pop(box_key, None)
     
     def select_all_artworks(self, box_key: str):
         """Select all visible (non-hidden) artworks in a box."""
         if box_key in self.results_per_box:
-            results = self.results_per_box[box_key].results
             # Only select visible artworks (not marked as hidden)
-            self.selected_artworks[box_key] = {
-                r.get('id', r.get('inventory_number')) 
-                for r in results 
-                if not r.get('_hidden', False)
-            }
+            self.selected_artworks[box_key] = set(self.results_per_box[box_key].visible_ids())
+            self._selection_snapshots.pop(box_key, None)
     
     def deselect_all_artworks(self, box_key: str):
         """Deselect all artworks in a box."""
         if box_key in self.selected_artworks:
             self.selected_artworks[box_key].clear()
+            self._selection_snapshots.pop(box_key, None)
     
-    def get_selected_artworks(self, box_key: str) -> set:
-        """Get selected artwork IDs for a box."""
-        return self.selected_artworks.get(box_key, set())
+    def get_selected_artworks(self, box_key: str) -> frozenset:
+        """Get selected artwork IDs for a box (immutable snapshot, rebuilt only after a change)."""
+        snapshot = self._selection_snapshots.get(box_key)
+        if snapshot is None:
+            snapshot = self._selection_snapshots[box_key] = frozenset(self.selected_artworks.get(box_key, ()))
+        return snapshot
     
     def has_selected_artworks(self, box_key: str) -> bool:
         """Check if any artworks are selected in a box."""
@@ -176,4 +229,4 @@ class LabelState:
     
     def is_artwork_selected(self, box_key: str, artwork_id: str) -> bool:
         """Check if an artwork is selected."""
-        return artwork_id in self.selected_artworks.get(box_key, set())
+        return artwork_id in self.selected_artworks.get(box_key, ())
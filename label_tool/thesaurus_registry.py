@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ThesaurusInfo:
     """Information about a thesaurus."""
     id: str                    # Internal identifier
@@ -51,6 +51,10 @@ AVAILABLE_THESAURI = [
     ),
 ]
 
+# Lookup indexes, built once
+_BY_NAME = {t.display_name: t for t in AVAILABLE_THESAURI}
+_BY_ID = {t.id: t for t in AVAILABLE_THESAURI}
+
 
 def get_thesaurus_names() -> List[str]:
     """Get list of thesaurus display names for UI."""
@@ -59,15 +63,9 @@ def get_thesaurus_names() -> List[str]:
 
 def get_thesaurus_by_name(name: str) -> Optional[ThesaurusInfo]:
     """Get thesaurus info by display name."""
-    for thesaurus in AVAILABLE_THESAURI:
-        if thesaurus.display_name == name:
-            return thesaurus
-    return None
+    return _BY_NAME.get(name)
 
 
 def get_thesaurus_by_id(thesaurus_id: str) -> Optional[ThesaurusInfo]:
     """Get thesaurus info by ID."""
-    for thesaurus in AVAILABLE_THESAURI:
-        if thesaurus.id == thesaurus_id:
-            return thesaurus
-    return None
+    return _BY_ID.get(thesaurus_id)
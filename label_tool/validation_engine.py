@@ -117,6 +117,7 @@ class ValidationEngine:
             
             results[column_key] = box_results
         
+        state.mark_results_dirty()
         return results
     
     async def _run_algorithm(
@@ -116,7 +116,7 @@ def render_result_box(
         # Column header with title, count badge, and collapse button
         # Count only visible (non-hidden) results
         if results:
-            visible_count = len([r for r in results.results if not r.get('_hidden', False)])
+            visible_count = len(results.visible_results())
         else:
             visible_count = 0
         
@@ -165,8 +165,8 @@ def render_result_box(
                 
                 # Results area
                 if results and results.results:
-                    # Filter out hidden artworks (marked with _hidden flag)
-                    visible_results = [r for r in results.results if not r.get('_hidden', False)]
+                    # Hidden artworks (marked with _hidden flag) are filtered out by ValidationResults
+                    visible_results = results.visible_results()
                     
                     # Limit results based on max_items
                     display_results = visible_results[:max_items] if max_items else visible_results
@@ -243,7 +243,7 @@ def render_algorithm_box(
         # Algorithm header with close button (X)
         # Count only visible (non-hidden) results
         if results:
-            visible_count = len([r for r in results.results if not r.get('_hidden', False)])
+            visible_count = len(results.visible_results())
         else:
             visible_count = 0
         
@@ -282,8 +282,8 @@ def render_algorithm_box(
             
             # Results area
             if results and results.results:
-                # Filter out hidden artworks (marked with _hidden flag)
-                visible_results = [r for r in results.results if not r.get('_hidden', False)]
+                # Hidden artworks (marked with _hidden flag) are filtered out by ValidationResults
+                visible_results = results.visible_results()
                 
                 # Limit results based on max_items
                 display_results = visible_results[:max_items] if max_items else visible_results
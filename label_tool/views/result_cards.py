@@ -9,6 +9,7 @@ from typing import List, Dict, Any, Callable, Optional
 from loguru import logger
 import routes
 from pages import detail
+from ..state import get_artwork_id
 
 
 def show_artwork_detail(artwork_data):
@@ -56,7 +57,7 @@ def render_result_grid_view(
     # Use inline style for grid columns to ensure compatibility
     with ui.element('div').classes('grid gap-4 w-full').style(f'grid-template-columns: repeat({grid_cols}, minmax(0, 1fr));'):
         for result in results:
-            artwork_id = result.get('id', result.get('inventory_number'))
+            artwork_id = get_artwork_id(result)
             is_selected = selected_ids and artwork_id in selected_ids if selected_ids else False
             
             # Gallery tile with image and metadata overlay
@@ -114,7 +115,7 @@ def render_result_list_view(
     """
     with ui.column().classes('w-full gap-3'):
         for result in results:
-            artwork_id = result.get('id', result.get('inventory_number'))
+            artwork_id = get_artwork_id(result)
             is_selected = selected_ids and artwork_id in selected_ids if selected_ids else False
             
             # List item card with thumbnail and metadata side by side
@@ -38,7 +38,7 @@ def render_ai_results_row(controller):
                 algo_box_key = f"AI-{algo_name}"
                 algo_results = state.results_per_box.get(algo_box_key)
                 if algo_results:
-                    total_results += len([r for r in algo_results.results if not r.get('_hidden', False)])
+                    total_results += len(algo_results.visible_results())
             
             render_column_header(
                 title="AI Results",
@@ -32,7 +32,7 @@ UI Layout Structure:
 """
 
 from nicegui import ui, app
-from backend.supabase_client import SupabaseClient
+from backend.supabase_client import get_supabase_client
 from config import settings
 from ui_components.header import render_header
 from loguru import logger
@@ -102,7 +102,7 @@ class DetailPageController:
             return
         
         try:
-            client = SupabaseClient()
+            client = get_supabase_client()
             
             # Get existing tags
             self.current_tags = client.get_tags_for_artwork(inventory)
@@ -132,20 +132,14 @@ class DetailPageController:
             return
         
         try:
-            client = SupabaseClient()
+            client = get_supabase_client()
             
-            # Get the correct tag_id from the 'tags' table (not iconographic_tags)
-            # artwork-tags has a foreign key to tags.id, not iconographic_tags.id
-            correct_tag_id = client.get_tagID_by_label(label)
-            
-            if correct_tag_id is None:
-                ui.notify(f'Tag not found in tags table: {label}', type='negative')
-                logger.error(f"Tag '{label}' exists in iconographic_tags but not in tags table")
-                return
-            
-            success = client.insert_artwork_tag_link(inventory, correct_tag_id, provenance='AI')
-            
-            if success:
+            # Look up the label in the 'tags' table (not iconographic_tags) and link it in one RPC;
+            # artwork-tags has a foreign key to tags.id, so keep the returned id.
+            # Labels missing from 'tags' are not created here (apply_tag returns None).
+            correct_tag_id = client.apply_tag(inventory, label, provenance='AI')
+
+            if correct_tag_id is not None:
                 # Add to current tags (use correct_tag_id for consistency)
                 self.current_tags.append({'tag_id': correct_tag_id, 'label': label, 'provenance': 'AI'})
                 # Hide from recommendations (use iconographic tag_id for UI tracking)
@@ -154,7 +148,7 @@ class DetailPageController:
                 # Refresh UI
                 self.render_content()
             else:
-                ui.notify(f'Failed to add tag: {label}', type='negative')
+                ui.notify(f'Tag not found in tags table or failed to add: {label}', type='negative')
         except Exception as e:
             logger.error(f"Error accepting tag {label}: {e}")
             ui.notify(f'Error adding tag: {str(e)}', type='negative')
@@ -185,8 +179,8 @@ class DetailPageController:
         logger.info(f"Searching for artwork with inventory number: {inventory}")
         
         try:
-            client = SupabaseClient()
-            artwork = client.get_artwork_by_inventory(inventory)
+            client = get_supabase_client()
+            artwork = client.get_artwork_metadata(inventory)
             
             if artwork:
                 # Update state and refresh UI
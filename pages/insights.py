@@ -1,6 +1,6 @@
 from nicegui import ui, app
 from ui_components.header import render_header
-from backend.supabase_client import SupabaseClient
+from backend.supabase_client import get_supabase_client
 from loguru import logger
 import routes
 import uuid
@@ -19,7 +19,7 @@ class InsightsPageController:
     
     def __init__(self):
         # Database client
-        self.db = SupabaseClient()
+        self.db = get_supabase_client()
         
         # Sample data - replace with real database queries
         self.data = self._load_sample_data()
@@ -276,13 +276,15 @@ class InsightsPageController:
                 
                 # Get user contribution data for selected user
                 all_contributions = self.db.get_user_contributions(days=90)
-                user_data = all_contributions.get(self.selected_user, [])
+                user_counts = all_contributions['users'].get(self.selected_user, [])
+                # Counts line up with the shared date list
+                user_dates = all_contributions['dates'][:len(user_counts)]
                 
                 # Create calendar heatmap
                 from datetime import datetime
                 
                 # Convert to calendar grid
-                dates_dt = [datetime.strptime(d['date'], '%Y-%m-%d') for d in user_data]
+                dates_dt = [datetime.strptime(d, '%Y-%m-%d') for d in user_dates]
                 
                 min_week = min(d.isocalendar()[1] for d in dates_dt)
                 max_week = max(d.isocalendar()[1] for d in dates_dt)
@@ -293,12 +295,11 @@ class InsightsPageController:
                 hover_text = [['' for _ in range(n_weeks)] for _ in range(7)]
                 
                 # Fill matrix
-                for d in user_data:
-                    date_obj = datetime.strptime(d['date'], '%Y-%m-%d')
+                for date_str, date_obj, count in zip(user_dates, dates_dt, user_counts):
                     week_idx = date_obj.isocalendar()[1] - min_week
                     day_idx = date_obj.weekday()
-                    matrix[day_idx][week_idx] = d['count']
-                    hover_text[day_idx][week_idx] = f"{d['date']}<br>Changes: {d['count']}"
+                    matrix[day_idx][week_idx] = count
+                    hover_text[day_idx][week_idx] = f"{date_str}<br>Changes: {count}"
                 
                 fig = go.Figure()
                 fig.add_trace(
@@ -476,14 +477,13 @@ class InsightsPageController:
             return
         
         # Extract data for Plotly table
-        header_values = ['Inventory Nr', 'Artist', 'Title', 'Tag', 'Level', 'Confidence']
+        header_values = ['Inventory Nr', 'Artist', 'Title', 'Tag', 'Provenance']
         cell_values = [
             [r['inventarisnummer'] for r in self.tag_search_results],
             [r['beschrijving_kunstenaar'] for r in self.tag_search_results],
             [r['beschrijving_titel'] for r in self.tag_search_results],
             [r['tag_name'] for r in self.tag_search_results],
-            [r['tag_level'] for r in self.tag_search_results],
-            [r['confidence'] for r in self.tag_search_results]
+            [r['provenance'] for r in self.tag_search_results]
         ]
         
         # Create Plotly table
@@ -498,7 +498,7 @@ class InsightsPageController:
             cells=dict(
                 values=cell_values,
                 fill_color=[['white', '#f9fafb'] * 5],  # Alternating row colors
-                align=['left', 'left', 'left', 'left', 'center', 'center'],
+                align=['left', 'left', 'left', 'left', 'center'],
                 font=dict(size=12),
                 height=30
             )
@@ -21,6 +21,7 @@ import routes
 
 from label_tool import LabelState, LabelService, ValidationEngine
 from label_tool import VALIDATION_LEVEL_AI, VALIDATION_LEVEL_HUMAN, VALIDATION_LEVEL_EXPERT
+from label_tool.state import get_artwork_id
 
 from label_tool.thesaurus_terms import get_thesaurus_terms
 from label_tool.views import render_search_bar, render_ai_results_row, render_validated_row
@@ -118,16 +119,14 @@ class LabelPageController:
                 logger.info(f"Algorithm '{algorithm}' selected")
                 # Open the corresponding box
                 box_key = f"AI-{algorithm}"
-                if box_key in self.state.closed_boxes:
-                    self.state.closed_boxes.remove(box_key)
+                self.state.closed_boxes.discard(box_key)
         else:
             if algorithm in self.state.selected_algorithms:
                 self.state.selected_algorithms.remove(algorithm)
                 logger.info(f"Algorithm '{algorithm}' deselected")
                 # Close the corresponding box
                 box_key = f"AI-{algorithm}"
-                if box_key not in self.state.closed_boxes:
-                    self.state.closed_boxes.append(box_key)
+                self.state.closed_boxes.add(box_key)
         
         logger.info(f"Currently selected algorithms: {self.state.selected_algorithms}")
         ui.notify(f'Selected algorithms: {", ".join(self.state.selected_algorithms) if self.state.selected_algorithms else "None"}')
@@ -410,7 +409,7 @@ class LabelPageController:
         remaining_artworks = []
         
         for artwork in source_results.results:
-            artwork_id = artwork.get('id', artwork.get('inventory_number'))
+            artwork_id = get_artwork_id(artwork)
             if artwork_id in selected_ids:
                 promoted_artworks.append(artwork)
             else:
@@ -425,13 +424,13 @@ class LabelPageController:
         target_results.total_count = len(target_results.results)
         
         # Debug logging
-        promoted_ids = [a.get('id', a.get('inventory_number')) for a in promoted_artworks]
+        promoted_ids = [get_artwork_id(a) for a in promoted_artworks]
         logger.info(f"Promoted artwork IDs (in order): {promoted_ids}")
         
         # Show full list with titles
         full_list = []
         for idx, artwork in enumerate(target_results.results[:10]):  # First 10
-            artwork_id = artwork.get('id', artwork.get('inventory_number'))
+            artwork_id = get_artwork_id(artwork)
             title = artwork.get('title', artwork.get('name', 'No title'))[:30]  # First 30 chars
             full_list.append(f"{idx}: {artwork_id} - {title}")
         
@@ -483,7 +482,7 @@ class LabelPageController:
         remaining_artworks = []
         
         for artwork in source_results.results:
-            artwork_id = artwork.get('id', artwork.get('inventory_number'))
+            artwork_id = get_artwork_id(artwork)
             if artwork_id in selected_ids:
                 demoted_artworks.append(artwork)
             else:
@@ -534,7 +533,7 @@ class LabelPageController:
         deleted_count = 0
         
         for artwork in box_results.results:
-            artwork_id = artwork.get('id', artwork.get('inventory_number'))
+            artwork_id = get_artwork_id(artwork)
             if artwork_id not in selected_ids:
                 remaining_artworks.append(artwork)
             else:
@@ -543,6 +542,7 @@ class LabelPageController:
         # Update box results
         box_results.results = remaining_artworks
         box_results.total_count = len(remaining_artworks)
+        self.state.mark_results_dirty()
         
         # TODO: Backend call to delete labels
         # try:
@@ -578,7 +578,7 @@ class LabelPageController:
         hidden_artworks_list = []
         
         for artwork in box_results.results:
-            artwork_id = artwork.get('id', artwork.get('inventory_number'))
+            artwork_id = get_artwork_id(artwork)
             if artwork_id in selected_ids:
                 # Mark as hidden and move to end
                 artwork['_hidden'] = True
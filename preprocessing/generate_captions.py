@@ -1,6 +1,7 @@
 # This script is used to generate captions for images in the fabritius dataset online.
 
 
+from dotenv import load_dotenv
 from backend.supabase_client import SupabaseClient
 from loguru import logger
 from backend.llms import LLMClient
@@ -224,4 +225,5 @@ def main():
     #clear_all_captions(db)
 
 if __name__ == "__main__":
+    load_dotenv()  # entry point: load .env before creating any clients
     main()
\ No newline at end of file
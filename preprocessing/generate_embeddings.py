@@ -10,6 +10,7 @@
 # - text-similarity-ada-001 (1024 dimensions)
 # - text-search-ada-doc-001 (1024 dimensions)
 
+from dotenv import load_dotenv
 from backend.supabase_client import SupabaseClient
 from loguru import logger
 from backend.llms import LLMClient
@@ -191,4 +192,5 @@ def main():
         logger.info("No unembedded artworks found to process")
 
 if __name__ == "__main__":
+    load_dotenv()  # entry point: load .env before creating any clients
     main()
\ No newline at end of file
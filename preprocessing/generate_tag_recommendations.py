@@ -13,6 +13,7 @@ Usage:
     Then run: python preprocessing/generate_tag_recommendations.py
 """
 
+from dotenv import load_dotenv
 from backend.supabase_client import SupabaseClient
 from loguru import logger
 import pandas as pd
@@ -289,4 +290,5 @@ def main():
 
 
 if __name__ == "__main__":
+    load_dotenv()  # entry point: load .env before creating any clients
     main()
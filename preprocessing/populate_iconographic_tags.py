@@ -11,6 +11,7 @@ Usage:
     python preprocessing/populate_iconographic_tags.py [--stats-only]
 """
 
+from dotenv import load_dotenv
 from backend.supabase_client import SupabaseClient
 from backend.llms import LLMClient
 from loguru import logger
@@ -321,4 +322,5 @@ def main():
 
 
 if __name__ == "__main__":
+    load_dotenv()  # entry point: load .env before creating any clients
     main()
@@ -5,6 +5,7 @@ Usage:
     python preprocessing/process_all_tag_embeddings.py
 """
 
+from dotenv import load_dotenv
 from backend.supabase_client import SupabaseClient
 from backend.llms import LLMClient
 from loguru import logger
@@ -151,4 +152,5 @@ def main():
 
 
 if __name__ == "__main__":
+    load_dotenv()  # entry point: load .env before creating any clients
     main()
@@ -1,3 +1,4 @@
+from dotenv import load_dotenv
 from backend.supabase_client import SupabaseClient
 from loguru import logger
 from backend.llms import LLMClient
@@ -44,4 +45,5 @@ def main():
         logger.info("No results found")
 
 if __name__ == "__main__":
+    load_dotenv()  # entry point: load .env before creating any clients
     main()
\ No newline at end of file
@@ -9,7 +9,7 @@ This module contains the backend execution logic for all search operators:
 
 import traceback
 from loguru import logger
-from backend.supabase_client import SupabaseClient
+from backend.supabase_client import get_supabase_client
 from backend.caption_generator import generate_caption_from_base64
 from config import settings
 
@@ -51,7 +51,7 @@ def execute_semantic_search(params: dict) -> tuple:
         
         # 2. Call backend vector search (get many results for filtering)
         logger.info("Step 1: Calling vector_search with limit=1000...")
-        db = SupabaseClient()
+        db = get_supabase_client()
         vector_results = db.vector_search(query_text, limit=1000)
         
         if not vector_results:
@@ -190,7 +190,7 @@ def execute_metadata_filter(params: dict) -> tuple:
         
         # Call backend - get all results first for count
         logger.info("Step 1: Querying database with filters...")
-        db = SupabaseClient()
+        db = get_supabase_client()
         
         # Get total count by querying with large page size
         full_results = db.get_artworks(
@@ -303,7 +303,7 @@ def execute_similarity_search(params: dict) -> tuple:
         
         # 3. Call backend vector search using caption (same as semantic search)
         logger.info("Step 2: Calling vector_search with caption...")
-        db = SupabaseClient()
+        db = get_supabase_client()
         vector_results = db.vector_search(caption, limit=1000)
         
         if not vector_results:
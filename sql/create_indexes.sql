@@ -0,0 +1,103 @@
+-- Create (non-vector) indexes for the query patterns used by the backend
+-- See create_vector_indexes.sql for the pgvector indexes
+-- Run dedupe_tags.sql first: the unique indexes below fail on existing duplicates
+
+-- ============================================
+-- FABRITIUS TABLE: Uncaptioned artworks (caption generation)
+-- ============================================
+
+-- Partial index: only artworks that still need a GPT Vision caption.
+-- Used by the get_uncaptioned() RPC (stored_procedures.sql), which pages through
+-- this subset by inventarisnummer (keyset pagination) instead of filtering the full table.
+CREATE INDEX IF NOT EXISTS idx_uncaptioned
+ON fabritius (inventarisnummer)
+WHERE gpt_vision_caption IS NULL
+  AND "imageOpacLink" IS NOT NULL
+  AND btrim("imageOpacLink") <> '';
+
+
+-- ============================================
+-- FABRITIUS TABLE: Year range filter
+-- ============================================
+
+-- beschrijving_datering is free text ("1642", "ca. 1640", "1640-1650"), so comparing it
+-- as a string is wrong and can't use an index. year_int holds the first 4-digit year
+-- (NULL if there is none); the year_range filter in _apply_search_filters() uses it.
+ALTER TABLE fabritius
+ADD COLUMN IF NOT EXISTS year_int smallint
+GENERATED ALWAYS AS ((substring(beschrijving_datering from '(\d{4})'))::smallint) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_fabritius_year_int
+ON fabritius (year_int);
+
+
+-- ============================================
+-- FABRITIUS TABLE: Artist name search
+-- ============================================
+
+-- Full-text vector over the artist's first and last name ('simple' config: no stemming
+-- or stop words, names are matched as written). Used by the search_by_artist() RPC
+-- (stored_procedures.sql) instead of two OR'ed ILIKE '%...%' filters.
+ALTER TABLE fabritius
+ADD COLUMN IF NOT EXISTS artist_tsv tsvector
+GENERATED ALWAYS AS (
+    to_tsvector('simple', coalesce(kunstenaar_voornaam, '') || ' ' || coalesce(kunstenaar_familienaam, ''))
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_fabritius_artist_tsv
+ON fabritius USING gin (artist_tsv);
+
+
+-- ============================================
+-- ARTWORK-TAGS TABLE: Link lookups
+-- ============================================
+
+-- Unique (artwork_id, tag_id): one link per artwork and tag. Required by the
+-- ON CONFLICT (artwork_id, tag_id) in apply_tag() (stored_procedures.sql), and makes
+-- delete_artwork_tag_links() and the .eq("artwork_id", ...).eq("tag_id", ...) filters
+-- in supabase_client.py index seeks instead of sequential scans on "artwork-tags".
+CREATE UNIQUE INDEX IF NOT EXISTS idx_artwork_tags_artwork_tag_unique
+ON "artwork-tags" (artwork_id, tag_id);
+
+-- Superseded by the unique index above
+DROP INDEX IF EXISTS idx_artwork_tags_artwork_tag;
+
+-- Partial index on the AI-generated links only: promote_artwork_tag_link()
+-- filters on provenance = 'AI' and only ever touches this subset.
+CREATE INDEX IF NOT EXISTS idx_artwork_tags_ai
+ON "artwork-tags" (artwork_id, tag_id)
+WHERE provenance = 'AI';
+
+
+-- ============================================
+-- TAGS TABLE: Partial label search
+-- ============================================
+
+-- Trigram index so ILIKE '%...%' on tags.label (e.g. search_artworks_by_tag via
+-- artwork_with_tags_view) can use an index scan instead of a sequential scan.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_tags_label_trgm
+ON tags USING gin (label gin_trgm_ops);
+
+-- Unique label: required by the ON CONFLICT (label) upsert in apply_tag()
+-- (stored_procedures.sql) and doubles as the lookup index for tag labels.
+CREATE UNIQUE INDEX IF NOT EXISTS idx_tags_label_unique
+ON tags (label);
+
+
+-- ============================================
+-- FABRITIUS TABLE: Partial text search
+-- ============================================
+
+-- Trigram indexes for the ILIKE '%...%' filters in _apply_search_filters()
+-- (inventory number, artist, title); without them every search is a sequential scan.
+-- pg_trgm is enabled in the TAGS section above.
+CREATE INDEX IF NOT EXISTS idx_fabritius_inventarisnummer_trgm
+ON fabritius USING gin (inventarisnummer gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_fabritius_kunstenaar_trgm
+ON fabritius USING gin (beschrijving_kunstenaar gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_fabritius_titel_trgm
+ON fabritius USING gin (beschrijving_titel gin_trgm_ops);
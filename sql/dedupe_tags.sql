@@ -0,0 +1,43 @@
+-- Remove duplicate tags and artwork-tag links
+-- Run this once BEFORE create_indexes.sql: the unique indexes idx_tags_label_unique and
+-- idx_artwork_tags_artwork_tag_unique can't be created while duplicates exist.
+-- Safe to re-run (does nothing when there are no duplicates).
+
+-- ============================================
+-- TAGS TABLE: one row per label
+-- ============================================
+
+-- Point links to a duplicate label at the lowest tags.id for that label...
+WITH ranked AS (
+    SELECT id, min(id) OVER (PARTITION BY label) AS keep_id
+    FROM tags
+)
+UPDATE "artwork-tags" at
+SET tag_id = r.keep_id
+FROM ranked r
+WHERE at.tag_id = r.id
+  AND r.id <> r.keep_id;
+
+-- ...then drop the duplicate tags themselves
+DELETE FROM tags t
+USING tags k
+WHERE t.label = k.label
+  AND t.id > k.id;
+
+
+-- ============================================
+-- ARTWORK-TAGS TABLE: one link per (artwork_id, tag_id)
+-- ============================================
+
+-- Keep the link with the highest provenance (EXPERT > HUMAN > AI), so a validated
+-- link is never dropped in favour of its AI duplicate (also covers the links merged above)
+DELETE FROM "artwork-tags" at
+USING (
+    SELECT ctid, row_number() OVER (
+        PARTITION BY artwork_id, tag_id
+        ORDER BY CASE provenance WHEN 'EXPERT' THEN 3 WHEN 'HUMAN' THEN 2 WHEN 'AI' THEN 1 ELSE 0 END DESC, ctid
+    ) AS rn
+    FROM "artwork-tags"
+) d
+WHERE at.ctid = d.ctid
+  AND d.rn > 1;
@@ -0,0 +1,127 @@
+-- Denormalized row counters for the Insights dashboard
+-- Used by backend/supabase_client.py: get_total_artworks, get_unique_tags_count, get_assigned_tags_count
+-- read a single row here instead of running count(*) over the full tables.
+
+-- ============================================
+-- COUNTER TABLE
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS row_counts (
+    table_name text PRIMARY KEY,
+    n bigint NOT NULL DEFAULT 0
+);
+
+-- Seed with the current counts (re-run to resync if the counters ever drift)
+INSERT INTO row_counts (table_name, n)
+SELECT 'fabritius', count(*) FROM fabritius
+ON CONFLICT (table_name) DO UPDATE SET n = EXCLUDED.n;
+
+INSERT INTO row_counts (table_name, n)
+SELECT 'tags', count(*) FROM tags
+ON CONFLICT (table_name) DO UPDATE SET n = EXCLUDED.n;
+
+INSERT INTO row_counts (table_name, n)
+SELECT 'artwork-tags', count(*) FROM "artwork-tags"
+ON CONFLICT (table_name) DO UPDATE SET n = EXCLUDED.n;
+
+-- ============================================
+-- TRIGGERS
+-- ============================================
+-- Statement-level: one counter UPDATE per INSERT/DELETE statement (counting its transition
+-- table), not one per row, so bulk loads and concurrent writers don't pile up on the counter row.
+-- Transition tables allow a single event per trigger, hence separate insert and delete triggers.
+
+DROP TRIGGER IF EXISTS fabritius_row_count ON fabritius;
+DROP TRIGGER IF EXISTS tags_row_count ON tags;
+DROP TRIGGER IF EXISTS artwork_tags_row_count ON "artwork-tags";
+DROP FUNCTION IF EXISTS bump_row_count();
+
+CREATE OR REPLACE FUNCTION row_count_add()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE row_counts
+    SET n = n + (SELECT count(*) FROM new_rows)
+    WHERE table_name = TG_TABLE_NAME;
+    RETURN NULL;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION row_count_subtract()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE row_counts
+    SET n = n - (SELECT count(*) FROM old_rows)
+    WHERE table_name = TG_TABLE_NAME;
+    RETURN NULL;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION row_count_reset()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE row_counts
+    SET n = 0
+    WHERE table_name = TG_TABLE_NAME;
+    RETURN NULL;
+END
+$$;
+
+-- fabritius
+DROP TRIGGER IF EXISTS fabritius_row_count_insert ON fabritius;
+CREATE TRIGGER fabritius_row_count_insert
+AFTER INSERT ON fabritius
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION row_count_add();
+
+DROP TRIGGER IF EXISTS fabritius_row_count_delete ON fabritius;
+CREATE TRIGGER fabritius_row_count_delete
+AFTER DELETE ON fabritius
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION row_count_subtract();
+
+DROP TRIGGER IF EXISTS fabritius_row_count_truncate ON fabritius;
+CREATE TRIGGER fabritius_row_count_truncate
+AFTER TRUNCATE ON fabritius
+FOR EACH STATEMENT EXECUTE FUNCTION row_count_reset();
+
+-- tags
+DROP TRIGGER IF EXISTS tags_row_count_insert ON tags;
+CREATE TRIGGER tags_row_count_insert
+AFTER INSERT ON tags
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION row_count_add();
+
+DROP TRIGGER IF EXISTS tags_row_count_delete ON tags;
+CREATE TRIGGER tags_row_count_delete
+AFTER DELETE ON tags
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION row_count_subtract();
+
+DROP TRIGGER IF EXISTS tags_row_count_truncate ON tags;
+CREATE TRIGGER tags_row_count_truncate
+AFTER TRUNCATE ON tags
+FOR EACH STATEMENT EXECUTE FUNCTION row_count_reset();
+
+-- artwork-tags
+DROP TRIGGER IF EXISTS artwork_tags_row_count_insert ON "artwork-tags";
+CREATE TRIGGER artwork_tags_row_count_insert
+AFTER INSERT ON "artwork-tags"
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION row_count_add();
+
+DROP TRIGGER IF EXISTS artwork_tags_row_count_delete ON "artwork-tags";
+CREATE TRIGGER artwork_tags_row_count_delete
+AFTER DELETE ON "artwork-tags"
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION row_count_subtract();
+
+DROP TRIGGER IF EXISTS artwork_tags_row_count_truncate ON "artwork-tags";
+CREATE TRIGGER artwork_tags_row_count_truncate
+AFTER TRUNCATE ON "artwork-tags"
+FOR EACH STATEMENT EXECUTE FUNCTION row_count_reset();
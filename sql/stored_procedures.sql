@@ -15,3 +15,162 @@ order by caption_embedding <=> query_embedding
 limit match_count;
 
 
+
+
+-- get_caption_stats function (caption progress in a single scan)
+-- Used by backend/caption_generator.py: db.client.rpc("get_caption_stats")
+-- Returns one row: total (artworks with an image), captioned (of those, with a GPT caption)
+
+CREATE OR REPLACE FUNCTION get_caption_stats()
+RETURNS TABLE (total bigint, captioned bigint)
+LANGUAGE sql STABLE
+AS $$
+    SELECT
+        count(*) FILTER (WHERE "imageOpacLink" IS NOT NULL),
+        count(*) FILTER (WHERE "imageOpacLink" IS NOT NULL AND gpt_vision_caption IS NOT NULL)
+    FROM fabritius;
+$$;
+
+
+-- get_uncaptioned function (next page of artworks that still need a caption)
+-- Used by backend/caption_generator.py: db.client.rpc("get_uncaptioned", {"n": ..., "after": ...})
+-- Arguments: n (page size), after (last inventarisnummer of the previous page, NULL for the first page)
+-- Served by the idx_uncaptioned partial index (create_indexes.sql)
+
+CREATE OR REPLACE FUNCTION get_uncaptioned(n int, after text DEFAULT NULL)
+RETURNS TABLE (inventarisnummer text, "imageOpacLink" text)
+LANGUAGE sql STABLE
+AS $$
+    SELECT f.inventarisnummer, f."imageOpacLink"
+    FROM fabritius f
+    WHERE f.gpt_vision_caption IS NULL
+      AND f."imageOpacLink" IS NOT NULL
+      AND btrim(f."imageOpacLink") <> ''
+      AND (after IS NULL OR f.inventarisnummer > after)
+    ORDER BY f.inventarisnummer
+    LIMIT n;
+$$;
+
+
+-- delete_artwork_tag_links function (remove many artwork-tag links in one statement)
+-- Used by backend/supabase_client.py: db.client.rpc("delete_artwork_tag_links", {"pairs": [...]})
+-- Arguments: pairs (jsonb array of {"artwork_id": ..., "tag_id": ...})
+-- Returns the number of deleted links
+
+CREATE OR REPLACE FUNCTION delete_artwork_tag_links(pairs jsonb)
+RETURNS int
+LANGUAGE sql
+AS $$
+    WITH deleted AS (
+        DELETE FROM "artwork-tags" at
+        USING jsonb_to_recordset(pairs) AS x(artwork_id text, tag_id bigint)
+        WHERE at.artwork_id = x.artwork_id
+          AND at.tag_id = x.tag_id
+        RETURNING 1
+    )
+    SELECT count(*)::int FROM deleted;
+$$;
+
+
+-- update_captions function (write many GPT vision captions in one statement)
+-- Used by backend/caption_generator.py: db.client.rpc("update_captions", {"captions": [...]})
+-- Arguments: captions (jsonb array of {"inventarisnummer": ..., "caption": ...})
+-- Returns the number of updated artworks. A plain UPDATE: unknown inventory numbers are
+-- skipped (an upsert would insert a caption-only row, and trip NOT NULL columns).
+
+CREATE OR REPLACE FUNCTION update_captions(captions jsonb)
+RETURNS int
+LANGUAGE sql
+AS $$
+    WITH updated AS (
+        UPDATE fabritius f
+        SET gpt_vision_caption = r.caption
+        FROM jsonb_to_recordset(captions) AS r(inventarisnummer text, caption text)
+        WHERE f.inventarisnummer = r.inventarisnummer
+        RETURNING 1
+    )
+    SELECT count(*)::int FROM updated;
+$$;
+
+
+-- artworks_having_tag function (which of the given artworks already carry a tag)
+-- Used by backend/supabase_client.py: db.client.rpc("artworks_having_tag", {"invs": [...], "lbl": ...})
+-- Arguments: invs (inventarisnummers to check), lbl (tag label)
+-- Returns one distinct array instead of a row per matching artwork-tag link
+
+CREATE OR REPLACE FUNCTION artworks_having_tag(invs text[], lbl text)
+RETURNS text[]
+LANGUAGE sql STABLE
+AS $$
+    SELECT ARRAY(
+        SELECT DISTINCT inventarisnummer
+        FROM artwork_with_tags_view
+        WHERE inventarisnummer = ANY(invs)
+          AND label = lbl
+    );
+$$;
+
+
+-- apply_tag function (look up or create the tag and link it to an artwork, in one transaction)
+-- Used by backend/supabase_client.py: db.client.rpc("apply_tag", {"_inv": ..., "_label": ..., "_prov": ..., "_create": ...})
+-- Arguments: _inv (inventarisnummer), _label (tag label), _prov (provenance, e.g. 'AI' or 'EXPERT'),
+--            _create (create the tag if the label doesn't exist yet; default false)
+-- Returns the tags.id of the label, or NULL (nothing linked) if the label doesn't exist and _create is false.
+-- An existing link is left as is. Relies on idx_tags_label_unique and idx_artwork_tags_artwork_tag_unique
+-- (create_indexes.sql)
+
+DROP FUNCTION IF EXISTS apply_tag(text, text, text);
+
+CREATE OR REPLACE FUNCTION apply_tag(_inv text, _label text, _prov text, _create boolean DEFAULT false)
+RETURNS bigint
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    tid bigint;
+BEGIN
+    IF _create THEN
+        INSERT INTO tags (label)
+        VALUES (_label)
+        ON CONFLICT (label) DO UPDATE SET label = EXCLUDED.label
+        RETURNING id INTO tid;
+    ELSE
+        SELECT id INTO tid FROM tags WHERE label = _label;
+        IF tid IS NULL THEN
+            RETURN NULL;
+        END IF;
+    END IF;
+
+    INSERT INTO "artwork-tags" (artwork_id, tag_id, provenance)
+    VALUES (_inv, tid, _prov)
+    ON CONFLICT (artwork_id, tag_id) DO NOTHING;
+
+    RETURN tid;
+END
+$$;
+
+-- apply_tag_to_artworks (bulk variant of apply_tag) had no caller and was removed
+DROP FUNCTION IF EXISTS apply_tag_to_artworks(text, text, text[]);
+
+
+-- search_by_artist function (artworks whose artist first/last name matches a query)
+-- Used by backend/supabase_client.py: db.client.rpc("search_by_artist", {"q": ...}), further
+-- filters / ordering / limits are chained on the result like on a table
+-- Arguments: q (one or more name words; every word must match the start of a name part)
+-- Served by the idx_fabritius_artist_tsv GIN index (create_indexes.sql)
+--
+-- Word-prefix matching, not substring matching like the ILIKE '%...%' filter it replaces:
+-- "rub" and "peter rub" find Rubens, "ubens" does not.
+-- q is split into lexemes by the same 'simple' parser as artist_tsv, so punctuation, quotes and
+-- backslashes never reach the tsquery syntax. A q without any word matches nothing.
+
+CREATE OR REPLACE FUNCTION search_by_artist(q text)
+RETURNS SETOF fabritius
+LANGUAGE sql STABLE
+AS $$
+    SELECT f.*
+    FROM fabritius f
+    WHERE f.artist_tsv @@ to_tsquery('simple', (
+        SELECT string_agg(quote_literal(replace(lexeme, '\', '')) || ':*', ' & ')
+        FROM unnest(tsvector_to_array(to_tsvector('simple', q))) AS lexeme
+    ));
+$$;
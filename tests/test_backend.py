@@ -9,6 +9,10 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# The backend doesn't load .env itself: do it here, like the app's entry points
+from dotenv import load_dotenv
+load_dotenv()
+
 
 def test_supabase_connection():
     """Test 1: Verify Supabase connection works"""
@@ -132,7 +136,7 @@ def test_single_artwork():
         inv_number = results['items'][0]['inventarisnummer']
         logger.info(f"Fetching artwork: {inv_number}")
         
-        artwork = db.get_artwork_by_inventory(inv_number)
+        artwork = db.get_artwork_metadata(inv_number)
         
         if artwork:
             logger.info("Artwork details:")
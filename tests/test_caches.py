@@ -0,0 +1,144 @@
+"""
+Cache Invalidation Tests
+
+Guards the in-process caches against serving stale or shared data:
+- ValidationResults visible results (recomputed when results is reassigned)
+- LabelState selection snapshots and the has_any_results flag
+- The Supabase lookup cache (copies, invalidate_artwork_metadata)
+- The LabelService search cache (copies, TTL, eviction)
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from loguru import logger
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def test_visible_ids_follow_results():
+    """Test 1: visible_ids is recomputed after results is reassigned"""
+    logger.info("\n" + "="*50)
+    logger.info("TEST 1: ValidationResults visible ids")
+    logger.info("="*50)
+
+    from label_tool.state import ValidationResults
+
+    box = ValidationResults(box_key="AI-Text", box_label="AI-Text")
+    box.results = [{'id': 'a'}, {'id': 'b', '_hidden': True}]
+    assert box.visible_ids() == ('a',)
+
+    box.results = box.results + [{'id': 'c'}]
+    assert box.visible_ids() == ('a', 'c'), "A new results list should be rescanned"
+
+    box.clear()
+    assert box.visible_ids() == (), "clear() should drop the visible results"
+    logger.info("✓ visible_ids follows results")
+
+
+def test_label_state_selection_snapshots():
+    """Test 2: get_selected_artworks snapshots are dropped on every selection change"""
+    logger.info("\n" + "="*50)
+    logger.info("TEST 2: LabelState selection snapshots")
+    logger.info("="*50)
+
+    from label_tool import LabelState
+
+    state = LabelState()
+    box = state.get_box_results("AI-Text")
+    box.results = [{'id': 'a'}, {'id': 'b'}, {'id': 'c', '_hidden': True}]
+
+    assert state.get_selected_artworks("AI-Text") == frozenset()
+    state.toggle_artwork_selection("AI-Text", "a")
+    assert state.get_selected_artworks("AI-Text") == {'a'}
+
+    state.select_all_artworks("AI-Text")
+    assert state.get_selected_artworks("AI-Text") == {'a', 'b'}, "Hidden artworks are not selected"
+
+    state.toggle_artwork_selection("AI-Text", "b")
+    assert state.get_selected_artworks("AI-Text") == {'a'}
+
+    state.deselect_all_artworks("AI-Text")
+    assert state.get_selected_artworks("AI-Text") == frozenset()
+    logger.info("✓ Selection snapshots invalidated")
+
+
+def test_label_state_results_flag():
+    """Test 3: has_any_results rescans only after mark_results_dirty / clear_all_results"""
+    logger.info("\n" + "="*50)
+    logger.info("TEST 3: LabelState has_any_results")
+    logger.info("="*50)
+
+    from label_tool import LabelState
+
+    state = LabelState()
+    assert not state.has_any_results()
+
+    state.get_box_results("HUMAN").total_count = 3
+    assert not state.has_any_results(), "Cached until marked dirty"
+    state.mark_results_dirty()
+    assert state.has_any_results()
+
+    state.clear_all_results()
+    assert not state.has_any_results()
+    logger.info("✓ has_any_results invalidated")
+
+
+def test_lookup_cache_copies_and_invalidation():
+    """Test 4: Supabase lookup cache hands out copies and drops metadata on invalidation"""
+    logger.info("\n" + "="*50)
+    logger.info("TEST 4: Supabase lookup cache")
+    logger.info("="*50)
+
+    from backend import supabase_client as sc
+
+    sc._lookup_cache.clear()
+    row = {'inventarisnummer': 'inv-1', 'gpt_vision_caption': 'old'}
+    sc._lookup_put(("metadata", "inv-1"), row)
+    sc._lookup_put(("metadata", "inv-2"), {'inventarisnummer': 'inv-2'})
+
+    row['gpt_vision_caption'] = 'changed by caller'
+    cached = sc._lookup_get(("metadata", "inv-1"))
+    assert cached['gpt_vision_caption'] == 'old', "The cache should store a copy"
+    cached['gpt_vision_caption'] = 'changed again'
+    assert sc._lookup_get(("metadata", "inv-1"))['gpt_vision_caption'] == 'old', "The cache should return a copy"
+
+    sc.invalidate_artwork_metadata(["inv-1"])
+    assert sc._lookup_get(("metadata", "inv-1")) is sc._MISSING
+    assert sc._lookup_get(("metadata", "inv-2")) is not sc._MISSING, "Other artworks stay cached"
+
+    sc.invalidate_artwork_metadata()
+    assert sc._lookup_get(("metadata", "inv-2")) is sc._MISSING
+    logger.info("✓ Lookup cache copies and invalidates")
+
+
+def test_label_service_cache(monkeypatch):
+    """Test 5: LabelService search cache copies, expires and evicts"""
+    logger.info("\n" + "="*50)
+    logger.info("TEST 5: LabelService cache")
+    logger.info("="*50)
+
+    from label_tool import label_service
+    from label_tool.label_service import LabelService
+
+    label_service._label_cache.clear()
+    service = LabelService("test")
+
+    first = asyncio.run(service.search_labels("Crown"))
+    first[0]['name'] = 'changed by caller'
+    assert asyncio.run(service.search_labels("Crown"))[0]['name'] == 'Crown', "The cache should return a copy"
+    assert asyncio.run(service.search_labels("crown "))[0]['name'] == 'crown ', "Keyed on the exact query"
+
+    service.invalidate()
+    assert not [k for k in label_service._label_cache if k[0] == "test"], "invalidate() should drop the thesaurus"
+
+    monkeypatch.setattr(label_service, "LABEL_CACHE_MAXSIZE", 2)
+    for query in ("a", "b", "c"):
+        asyncio.run(service.search_labels(query))
+    assert ("test", "search", "a") not in label_service._label_cache, "The oldest entry should be evicted"
+    assert len(label_service._label_cache) == 2
+
+    monkeypatch.setattr(label_service, "LABEL_CACHE_TTL", 0)
+    assert label_service._cache_get(("test", "search", "c")) is None, "Expired entries are not served"
+    logger.info("✓ LabelService cache copies, expires and evicts")
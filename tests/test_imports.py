@@ -0,0 +1,47 @@
+"""
+Label Tool Import Tests
+
+Guards the label_tool package layout:
+- Lazy package exports resolve to the real definitions
+- A single LabelState schema (box-based, with selection management)
+"""
+
+import sys
+from dataclasses import fields
+from pathlib import Path
+from loguru import logger
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def test_label_tool_exports():
+    """Test 1: Every name in label_tool.__all__ resolves"""
+    logger.info("\n" + "="*50)
+    logger.info("TEST 1: label_tool exports")
+    logger.info("="*50)
+
+    import label_tool
+
+    for name in label_tool.__all__:
+        assert getattr(label_tool, name) is not None, f"label_tool.{name} should resolve"
+    logger.info(f"✓ Resolved {len(label_tool.__all__)} exports")
+
+
+def test_label_state_schema():
+    """Test 2: LabelState is the box-based state with selection management"""
+    logger.info("\n" + "="*50)
+    logger.info("TEST 2: LabelState schema")
+    logger.info("="*50)
+
+    from label_tool import LabelState
+    from label_tool.state import ValidationResults
+
+    state_fields = {f.name for f in fields(LabelState)}
+    for name in ('results_per_box', 'closed_boxes', 'selected_artworks', 'hidden_artworks'):
+        assert name in state_fields, f"LabelState should have field '{name}'"
+
+    assert 'column_label' in {f.name for f in fields(ValidationResults)}, \
+        "ValidationResults should declare column_label (set by ValidationEngine)"
+    logger.info("✓ LabelState / ValidationResults schema OK")
+
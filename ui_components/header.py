@@ -1,13 +1,19 @@
+import functools
 from nicegui import ui
 from typing import Callable
 from config import settings, RESET_QUASAR_COLORS
 from loguru import logger
 import routes
 
+def _navigate(route: str) -> None:
+    """Navigate to the given route (bound to a route by navigate_to)."""
+    logger.info(f"Navigating to route: {route}")
+    ui.navigate.to(route)
+
 def navigate_to(route: str) -> Callable:
     """
     Create a navigation callback for the given route.
-    Returns a closure (=callable function) that navigates to the route when called.
+    Returns a callable (functools.partial of _navigate bound to the route) that navigates to the route when called.
     This allows configuring the route NOW, but executing navigation LATER (on button click).
     Example: navigate_to(routes.ROUTE_HOME) returns a function that navigates to '/'
     
@@ -17,29 +23,15 @@ def navigate_to(route: str) -> Callable:
     Returns:
         Function that navigates to the specified route when called
     """
-    def _navigate():
-        logger.info(f"Navigating to route: {route}")
-        ui.navigate.to(route)
-    return _navigate
+    return functools.partial(_navigate, route)
 
 def render_header():
     """
     Render the application header with navigation buttons.
-    Uses the Builder pattern: configure header via method chaining,
-    then call .build() to actually render it to the DOM.
+    Uses the Builder pattern: the header is configured once via method chaining
+    (see _build_header_spec), and .build() renders it to the DOM on every page load.
     """
-    header = (
-        HeaderBuilder()
-        .with_title(settings.title)
-        .with_subtitle(settings.subtitle)
-        .with_button('Search', navigate_to(routes.ROUTE_SEARCH))
-        .with_button('Detail', navigate_to(routes.ROUTE_DETAIL))
-        .with_button('Label', navigate_to(routes.ROUTE_LABEL))
-        .with_button('Chat', navigate_to(routes.ROUTE_CHAT))
-        .with_button('Insights', navigate_to(routes.ROUTE_INSIGHTS))
-        .with_login_button(settings.login_label, navigate_to(routes.ROUTE_LOGIN))
-    )
-    header.build()
+    _HEADER_SPEC.build()
 
 
 class HeaderBuilder:
@@ -114,4 +106,35 @@ class HeaderBuilder:
                 # Login button with distinct style
                 if self.login_button:
                     label, on_click_callback = self.login_button
-                    self._create_login_button(label, on_click_callback)
\ No newline at end of file
+                    self._create_login_button(label, on_click_callback)
+
+
+# Navigation buttons (label, on_click), built once at import
+_NAV_BUTTONS = tuple(
+    (label, navigate_to(route))
+    for label, route in (
+        ('Search', routes.ROUTE_SEARCH),
+        ('Detail', routes.ROUTE_DETAIL),
+        ('Label', routes.ROUTE_LABEL),
+        ('Chat', routes.ROUTE_CHAT),
+        ('Insights', routes.ROUTE_INSIGHTS),
+    )
+)
+
+
+def _build_header_spec() -> 'HeaderBuilder':
+    """Configure the application header (title, navigation and login buttons)."""
+    header = (
+        HeaderBuilder()
+        .with_title(settings.title)
+        .with_subtitle(settings.subtitle)
+        .with_login_button(settings.login_label, navigate_to(routes.ROUTE_LOGIN))
+    )
+    for label, on_click in _NAV_BUTTONS:
+        header.with_button(label, on_click)
+    return header
+
+
+# Header configuration is static: build it once at import and reuse it for every page render.
+# build() only reads the builder's state, so sharing one instance across requests is safe.
+_HEADER_SPEC = _build_header_spec()